@@ -102,7 +102,13 @@ class ProxyBenchmark:
         if proxies_dir.exists():
             shutil.rmtree(proxies_dir)
             print(f"   Removed: {proxies_dir}")
-        
+
+        # Remove the persisted probe/fingerprint cache so every configuration probes from scratch
+        cache_file = self.source_path.parent / 'proxy_logs' / 'proxy_cache.json'
+        if cache_file.exists():
+            cache_file.unlink()
+            print(f"   Removed: {cache_file}")
+
         print("✅ Cleanup complete (logs preserved)\n")
 
     def _run_proxy_generator(self, codec, worker_config):
@@ -1,8 +1,14 @@
 import platform
+import shutil
 import subprocess
-import json
+import threading
 from typing import Dict, List, Optional
 
+# ffmpeg resolved on PATH once, shared with proxy_generator, so every run passes
+# subprocess an executable with a directory
+FFMPEG = shutil.which('ffmpeg') or 'ffmpeg'
+
+
 class CodecConfiguration:
     CODEC_PROFILES = {
         'h264': {
@@ -99,10 +105,24 @@ class CodecConfiguration:
         'Windows': ['cuda', 'qsv']
     }
 
+    # NVDEC decoders forced by source codec, with the pixel formats they may be tried on.
+    # -hwaccel cuda already decodes H.264/HEVC on the GPU; AV1 and VP9 would otherwise
+    # be handed to libdav1d/libvpx. Whether this GPU can decode a given codec and pixel
+    # format is test-decoded once; anything else is left to ffmpeg's own decoder choice.
+    CUVID_DECODERS = {
+        'av1': ('av1_cuvid', frozenset({'yuv420p', 'yuv420p10le'})),
+        'vp9': ('vp9_cuvid', frozenset({'yuv420p', 'yuv420p10le'}))
+    }
+
     def __init__(self, selected_codec: str = "prores"):
         self.system = platform.system()
         self.selected_codec = selected_codec.lower()
         self.hw_acceleration = self._detect_hw_acceleration()
+        self._decoder_checks = {}  # {(decoder, pix_fmt): bool}
+        self._decoder_checks_lock = threading.Lock()
+        # Configs and filter chains depend only on these flags, so they are built once per combination
+        self._config_cache = {}  # {(is_mobile, is_hevc_10bit): config}
+        self._filter_cache = {}  # {(base_filter, needs_format_conversion, is_hevc_10bit): (video_filter, fallback_reason)}
         self._validate_codec()
 
     def _validate_codec(self) -> None:
@@ -126,7 +146,7 @@ class CodecConfiguration:
         """Test if specific hardware acceleration is supported"""
         try:
             subprocess.run(
-                ['ffmpeg', '-hwaccel', hwaccel, '-version'],
+                [FFMPEG, '-hwaccel', hwaccel, '-version'],
                 capture_output=True,
                 check=True
             )
@@ -134,35 +154,50 @@ class CodecConfiguration:
         except subprocess.CalledProcessError:
             return False
 
-    def _get_source_video_info(self, video_path: str) -> Dict[str, str]:
-        """Get source video format information to detect problematic combinations"""
+    def _check_cuvid_decoder(self, decoder: str, video_path: str) -> bool:
+        """Test if an NVDEC decoder can decode the first frame of a source"""
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-select_streams', 'v:0',
-                '-show_entries', 'stream=codec_name,profile,pix_fmt',
-                '-of', 'json',
-                str(video_path)
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
-            
-            if 'streams' in data and len(data['streams']) > 0:
-                stream = data['streams'][0]
-                return {
-                    'codec_name': stream.get('codec_name', 'unknown').lower(),
-                    'profile': stream.get('profile', 'unknown').lower(),
-                    'pix_fmt': stream.get('pix_fmt', 'unknown').lower()
-                }
-        except Exception:
-            # If detection fails, return safe defaults
-            pass
-        
+            subprocess.run(
+                [FFMPEG, '-v', 'error', '-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda',
+                 '-c:v', decoder, '-i', video_path, '-frames:v', '1', '-f', 'null', '-'],
+                capture_output=True,
+                check=True,
+                timeout=60
+            )
+            return True
+        except (OSError, subprocess.SubprocessError):
+            return False
+
+    def get_hw_decoder_args(self, source_info: Dict[str, str], hw_accel_args: List[str],
+                            video_path: str) -> List[str]:
+        """Get arguments selecting an explicit hardware decoder for the source
+
+        Only applies to the CUDA path that keeps frames on the GPU. Returns an empty list
+        (leaving decoder selection to ffmpeg, which falls back to software) when the
+        source codec or pixel format has no forced decoder, or the decoder failed its
+        one-time test decode on this GPU.
+        """
+        if self.hw_acceleration != 'cuda' or '-hwaccel_output_format' not in hw_accel_args:
+            return []
+
+        entry = self.CUVID_DECODERS.get(source_info.get('codec_name', 'unknown'))
+        pix_fmt = source_info.get('pix_fmt', 'unknown')
+        if entry is None or pix_fmt not in entry[1]:
+            return []
+
+        decoder = entry[0]
+        with self._decoder_checks_lock:
+            supported = self._decoder_checks.get((decoder, pix_fmt))
+            if supported is None:
+                supported = self._decoder_checks[(decoder, pix_fmt)] = self._check_cuvid_decoder(decoder, video_path)
+        return ['-c:v', decoder] if supported else []
+
+    def _video_info_from_stream(self, stream: dict) -> Dict[str, str]:
+        """Normalize an ffprobe video stream to the fields used for format detection"""
         return {
-            'codec_name': 'unknown',
-            'profile': 'unknown', 
-            'pix_fmt': 'unknown'
+            'codec_name': str(stream.get('codec_name', 'unknown')).lower(),
+            'profile': str(stream.get('profile', 'unknown')).lower(),
+            'pix_fmt': str(stream.get('pix_fmt', 'unknown')).lower()
         }
 
     def _is_hevc_10bit(self, video_info: Dict[str, str]) -> bool:
@@ -225,24 +260,38 @@ class CodecConfiguration:
         }
 
     def get_configuration(self, is_mobile: bool = False) -> Dict[str, List[str]]:
-        """Public method to get the full configuration"""
-        return self._get_codec_config(is_mobile)
+        """Public method to get the full configuration
+
+        The returned dict is shared between calls with the same flags and must not be modified.
+        """
+        key = (is_mobile, False)
+        config = self._config_cache.get(key)
+        if config is None:
+            config = self._config_cache[key] = self._get_codec_config(is_mobile)
+        return config
 
     def build_video_filter(self, base_filter: str, needs_format_conversion: bool = False, 
-                          video_path: str = None, target_codec: str = None) -> tuple[str, str]:
+                          target_codec: str = None, *,
+                          source_info: Dict[str, str]) -> tuple[str, str]:
         """Build the complete video filter chain with GPU-accelerated scaling for CUDA
         
+        source_info is the caller's already-probed source stream info.
+
         Returns:
             tuple: (video_filter, fallback_reason)
         """
-        # Detect source video format if path is provided
-        source_info = {}
-        if video_path:
-            source_info = self._get_source_video_info(video_path)
-        
         # Check for problematic HEVC 10-bit combination
         is_hevc_10bit = self._is_hevc_10bit(source_info)
-        
+
+        key = (base_filter, needs_format_conversion, is_hevc_10bit)
+        cached = self._filter_cache.get(key)
+        if cached is None:
+            cached = self._filter_cache[key] = self._build_video_filter(base_filter, needs_format_conversion, is_hevc_10bit)
+        return cached
+
+    def _build_video_filter(self, base_filter: str, needs_format_conversion: bool,
+                            is_hevc_10bit: bool) -> tuple[str, str]:
+        """Build the filter chain for a scaling filter and source format"""
         # Apply CUDA optimization fallback logic
         use_cpu_fallback = False
         fallback_reason = ""
@@ -260,9 +309,9 @@ class CodecConfiguration:
         else:
             # Use GPU scaling for CUDA when compatible
             if self.hw_acceleration == 'cuda':
-                # Replace CPU scale with GPU scale_cuda
+                # Replace CPU scale with GPU scale_cuda; swscale flags don't apply on the GPU
                 if base_filter.startswith('scale='):
-                    base_filter = base_filter.replace('scale=', 'scale_cuda=')
+                    base_filter = base_filter.replace('scale=', 'scale_cuda=').replace(':flags=fast_bilinear', '')
             
             filters = [base_filter]
             
@@ -295,8 +344,17 @@ class CodecConfiguration:
         """Get special codec configuration for HEVC 10-bit sources that uses H.264 encoding
         
         This configuration is designed to work around compatibility issues with HEVC 10-bit sources
-        by using H.264 encoding with CPU-based processing.
+        by using H.264 encoding with CPU-based processing. The returned dict is shared between
+        calls with the same flags and must not be modified.
         """
+        key = (is_mobile, True)
+        config = self._config_cache.get(key)
+        if config is None:
+            config = self._config_cache[key] = self._get_hevc_10bit_codec_config()
+        return config
+
+    def _get_hevc_10bit_codec_config(self) -> Dict[str, List[str]]:
+        """Build the H.264 configuration used for every HEVC 10-bit source"""
         # Force H.264 codec for 10-bit HEVC sources
         codec = 'h264'
         
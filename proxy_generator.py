@@ -8,19 +8,188 @@ import platform
 import argparse
 import re
 import shlex
+import hashlib
+import io
+import asyncio
+import logging
+import queue
+from collections import defaultdict, deque
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 import shutil
+import sqlite3
+import errno
 import threading
+import tempfile
+
+# Host OS, looked up once ('Windows', 'Darwin', 'Linux')
+_SYSTEM = platform.system()
 
 # Fix for Windows Unicode encoding issues
-if platform.system() == "Windows":
+if _SYSTEM == "Windows":
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-from codec_configuration import CodecConfiguration
+# orjson parses ffprobe output several times faster and accepts bytes directly, and
+# encodes the cache sidecar and benchmark JSON in C
+try:
+    from orjson import loads as _json_loads, dumps as _orjson_dumps, OPT_INDENT_2
+
+    def _json_dumps(data, indent=False):
+        """Encode data as UTF-8 JSON bytes"""
+        return _orjson_dumps(data, option=OPT_INDENT_2 if indent else None)
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(data, indent=False):
+        """Encode data as UTF-8 JSON bytes"""
+        return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+# PyAV reads stream metadata in-process, so probes don't spawn an ffprobe per file
+try:
+    import av
+except ImportError:
+    av = None
+
+from codec_configuration import CodecConfiguration, FFMPEG
+
+# Bytes read from each end of a source file when fingerprinting it for deduplication
+FINGERPRINT_CHUNK_BYTES = 1024 * 1024
+
+# Maximum number of ffprobe processes run concurrently when prefetching probes
+PROBE_CONCURRENCY = 64
+
+# ffprobe and exiftool resolved on PATH once (ffmpeg in codec_configuration); subprocess
+# only takes its posix_spawn fast path for an executable given with a directory
+FFPROBE = shutil.which('ffprobe') or 'ffprobe'
+EXIFTOOL = shutil.which('exiftool') or 'exiftool'
+
+# One ffprobe call returns every stream plus the container format; -threads 1 keeps
+# ffprobe from starting decoder threads next to the running transcodes
+PROBE_ARGS = (
+    FFPROBE,
+    '-v', 'quiet',
+    '-threads', '1',
+    '-show_streams',
+    '-show_format',
+    '-of', 'json'
+)
+
+# Proxy validation only asks for the first video stream's type; a readable proxy prints "video"
+VALIDATE_PROBE_ARGS = (
+    FFPROBE,
+    '-v', 'error',
+    '-threads', '1',
+    '-select_streams', 'v:0',
+    '-show_entries', 'stream=codec_type',
+    '-of', 'csv=p=0'
+)
+
+# Maximum number of concurrent ffprobe validations of existing proxies (I/O bound)
+VALIDATION_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files per exiftool invocation when batching metadata reads (keeps argv well under ARG_MAX)
+EXIFTOOL_BATCH_SIZE = 200
+
+# The only exiftool tags mobile footage detection looks at
+MOBILE_METADATA_TAGS = ['-AndroidVersion', '-DeviceManufacturer', '-CameraModelName', '-Make', '-Model']
+
+# Common mobile/consumer device manufacturers and models, matched anywhere in those tags
+_MOBILE_RE = re.compile(
+    r'android|samsung|pixel|oneplus|xiaomi|huawei|meta|ray-ban|osmo|pocket|gopro|insta360|action|phone|mobile|smartphone',
+    re.IGNORECASE
+)
+
+# Hardware accelerator test results, shared between runs and keyed by the ffmpeg binary
+HWACCEL_CACHE_FILE = Path.home() / '.cache' / 'proxy_generator' / 'hwaccels.json'
+
+# Log records buffered before the log file is written; close() flushes the remainder
+LOG_BUFFER_RECORDS = 64
+
+# Large pipe buffers so captured tool output is read in a few syscalls. On POSIX, Python's own
+# descriptors are non-inheritable already, and close_fds=False lets children start via
+# posix_spawn instead of fork + closing every descriptor
+SUBPROC_KW = dict(bufsize=1 << 20)
+if _SYSTEM != 'Windows':
+    SUBPROC_KW['close_fds'] = False
+
+# ffmpeg stderr is streamed and only its tail is kept for error reports
+STDERR_CHUNK_BYTES = 64 * 1024
+STDERR_TAIL_CHUNKS = 16
+
+# Fixed parts of every transcode command
+FFMPEG_PREFIX_ARGS = (FFMPEG, '-hide_banner', '-y')
+AUDIO_COPY_ARGS = ('-c:a', 'copy')
+AUDIO_AAC_ARGS = ('-c:a', 'aac', '-b:a', '128k')
+AUDIO_NONE_ARGS = ('-an',)
+
+# Upper bound for -threads passed to each ffmpeg, and the env var that overrides it
+MAX_FFMPEG_THREADS = 64
+FFMPEG_THREADS_ENV = 'PROXY_FFMPEG_THREADS'
+
+# Per-file codec decision block of the detailed report
+_CODEC_TMPL = (
+    "  Requested Codec: {requested_codec}\n"
+    "  Actual Codec Used: {actual_codec}\n"
+    "  Reason: {reason}\n"
+)
+
+# Compressed audio codecs that are copied into the proxy as-is
+COMPRESSED_AUDIO_CODECS = frozenset({
+    'aac', 'mp3', 'ac3', 'eac3', 'dts', 'truehd', 'flac', 'vorbis', 'opus'
+})
+
+# Uncompressed/large audio codecs that are re-encoded to AAC
+UNCOMPRESSED_AUDIO_CODECS = frozenset({
+    'pcm_s16be', 'pcm_s16le', 'pcm_s24be', 'pcm_s24le', 'pcm_s32be', 'pcm_s32le',
+    'pcm_f32be', 'pcm_f32le', 'pcm_f64be', 'pcm_f64le'
+})
+
+# Sony camera proxy suffix on the file stem (e.g. 20250630_ze1S03)
+_SONY_PROXY_RE = re.compile(r'S\d+$')
+_SONY_PROXY_ANYCASE_RE = re.compile(r'S\d+$', re.IGNORECASE)
+
+# Windows drive letter (C:) or UNC (\\server) prefix
+_WIN_DRIVE_OR_UNC_RE = re.compile(r'[A-Za-z]:|\\\\')
+
+# Characters that give shlex something to do in a pasted path
+_QUOTE_OR_ESC_RE = re.compile(r'[\\"\']')
+
+# The only characters shlex treats as whitespace (not NBSP, U+202F, \x0b, ...)
+_SHLEX_WHITESPACE_RE = re.compile(r'[ \t\r\n]+')
+
+class _UnknownDefault(dict):
+    """Mapping for str.format_map that renders missing keys as 'Unknown'"""
+    def __missing__(self, key):
+        return 'Unknown'
+
+class _BatchFileHandler(logging.FileHandler):
+    """FileHandler that flushes once per batch of records instead of after every record
+
+    Records go through the file object's buffer; warnings and above flush immediately.
+    """
+    def __init__(self, filename, capacity, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.capacity = capacity
+        self._pending = 0
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            self._pending += 1
+            if self._pending >= self.capacity or record.levelno >= logging.WARNING:
+                self.flush()
+                self._pending = 0
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 def format_time_human(seconds):
     """Convert seconds to human-readable MM:SS format"""
@@ -30,15 +199,56 @@ def format_time_human(seconds):
     seconds_remainder = int(seconds % 60)
     return f"{minutes}:{seconds_remainder:02d}"
 
+@lru_cache(maxsize=256)
+def _classify_audio(codec_name, bit_rate):
+    """Decide whether to copy or re-encode an audio stream
+
+    Returns:
+        tuple: (should_copy, reason)
+    """
+    if codec_name in COMPRESSED_AUDIO_CODECS:
+        return True, f"Compressed codec ({codec_name}) - copying"
+    elif codec_name in UNCOMPRESSED_AUDIO_CODECS:
+        return False, f"Uncompressed codec ({codec_name}) - re-encoding to AAC"
+    else:
+        # For unknown codecs, check bit rate if available
+        try:
+            bit_rate = int(bit_rate)
+            if bit_rate > 1000000:  # > 1 Mbps, likely uncompressed
+                return False, f"High bitrate ({bit_rate} bps) - re-encoding to AAC"
+            else:
+                return True, f"Unknown codec ({codec_name}) with reasonable bitrate - copying"
+        except (ValueError, TypeError):
+            return True, f"Unknown codec ({codec_name}) - copying (default)"
+
+def default_worker_count(concurrency_profile=None):
+    """Get the default number of concurrent ffmpeg processes for a concurrency profile
+
+    - cpu: libx264/libx265 spread one encode across every core, so run only a few encodes
+    - nvenc: consumer NVIDIA GPUs only allow a couple of concurrent encode sessions
+    - None: one process per physical core, max 8
+    """
+    cpu_count = os.cpu_count() or 1
+    if concurrency_profile == 'cpu':
+        return max(1, cpu_count // 8)
+    if concurrency_profile == 'nvenc':
+        return 2
+    return min(cpu_count // 2 or 1, 8)
+
 class ProxyGenerator:
-    def __init__(self, source_path, scale="quarter", codec="prores", parallel=True, max_workers=None, shutdown=False, json_output=False, skip_existing=False):
+    def __init__(self, source_path, scale="quarter", codec="prores", parallel=True, max_workers=None, shutdown=False, json_output=False, skip_existing=False, concurrency_profile=None, ffmpeg_threads=None, verbose=False):
         self.source_path = Path(source_path)
         self.scale = scale
         self.parallel = parallel
         self.max_workers = max_workers
+        self.concurrency_profile = concurrency_profile
+        self.ffmpeg_threads = ffmpeg_threads
+        self.threads_per_job = self._ffmpeg_threads_per_invocation()
+        self._threads_args = ('-threads', str(self.threads_per_job))
         self.shutdown = shutdown
         self.json_output = json_output
         self.skip_existing = skip_existing
+        self.verbose = verbose
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Create proxy_logs directory for logs and reports
@@ -46,8 +256,9 @@ class ProxyGenerator:
         self.proxy_logs_dir.mkdir(exist_ok=True)
         
         self.log_file = self.proxy_logs_dir / f"proxy-gen-logs-and-report-{self.timestamp}.txt"
+        self.log = self._setup_logging()
         self.report_file = None
-        self.video_extensions = {'.mp4', '.mov', '.mxf', '.avi', '.mkv'}
+        self.video_extensions = frozenset({'.mp4', '.mov', '.mxf', '.avi', '.mkv'})
 
         self.GENERAL_PROXIES_DIR = Path("/Volumes/samsungt5-512gb-ssd-apple/video-editing/proxies-general")
         self.stats = {
@@ -56,9 +267,14 @@ class ProxyGenerator:
             'skipped': 0,
             'moved': 0,
             'sony_proxies_moved': 0,
+            'deduplicated': 0,
             'start_time': time.time()
         }
-        self.processed_files_details = []
+        # Per-file records go to a sqlite file as each file finishes and are streamed back
+        # for the detailed report, rather than held in memory for the whole run
+        self.details_db_file = self.proxy_logs_dir / f"proxy-details-{self.timestamp}.db"
+        self._details_lock = threading.Lock()
+        self._details_db = self._open_details_db()
         
         # User choice tracking for duplicate proxy handling
         self.user_choice_for_duplicates = None  # None, 'yes_to_all', 'skip_all'
@@ -68,6 +284,8 @@ class ProxyGenerator:
 
         # Initialize codec configuration
         self.codec_config = CodecConfiguration(codec)
+        # Only the worker count is filled in when the benchmark JSON is written
+        self._benchmark_json_name_tmpl = f"benchmark-{self.codec_config.selected_codec}-{{workers}}workers-{self.timestamp}.json"
         
         # Store run parameters for reporting
         self.run_params = {
@@ -75,23 +293,58 @@ class ProxyGenerator:
             'codec_requested': codec,
             'parallel': parallel,
             'max_workers_requested': max_workers,
+            'concurrency_profile': concurrency_profile,
+            'ffmpeg_threads_requested': ffmpeg_threads,
             'shutdown': shutdown
         }
         
         # Thread-safe Sony proxy processing
         self.sony_proxy_lock = threading.Lock()
         self.processed_sony_proxies = set()  # Track already processed Sony proxies
-        
-        # Collect system information immediately
-        self.system_info = self.collect_system_info()
+
+        # Persistent cache sidecar shared across runs (source fingerprints -> proxies,
+        # ffprobe results keyed by path and validated against mtime/size)
+        self.cache_file = self.proxy_logs_dir / "proxy_cache.json"
+        self._cache_lock = threading.Lock()
+        self._cache_writer = None  # background _save_cache started by _print_final_stats
+        cache = self._load_cache()
+        self._fingerprints = {key: Path(path) for key, path in cache.get('fingerprints', {}).items()}
+        self._probe_cache = cache.get('probes', {})  # {str(video_path): {'mtime_ns', 'size', 'probe'}}
+        # Proxies this tool wrote or validated, as they were then {str(proxy_path): [mtime_ns, size]}
+        self._known_proxies = cache.get('proxies', {})
+
+        # Mobile footage detection results, batch-filled during the conflict scan {Path: bool}
+        self._mobile_cache = {}
+        # 'is_mobile' marker file check per source folder {Path: bool}
+        self._mobile_folder_cache = {}
+        # DirEntry of each source found by the walk, whose cached stat the scan reuses {Path: os.DirEntry}
+        self._source_entries = {}
+        # Whether a source folder has a legacy 'Proxies' subfolder {Path: bool}
+        self._old_proxies_exists = {}
+
+        # Proxy validation results {(str(proxy_path), mtime_ns, size): bool}
+        self._proxy_valid_cache = {}
+
+        # Directory listings, scanned once and reused by every file in the directory
+        self._dir_cache = {}  # {str(dir_path): (dir mtime_ns, ((os.DirEntry, stem, stem_lower, suffix_lower), ...))}
+        self._dir_cache_lock = threading.Lock()
+        self._plans = {}  # {Path: plan dict from _plan_file}
+        self._general_proxy_index = None  # (listing, {base name.lower(): [Path, ...]})
+        self._sony_seen = {}  # {str(proxies_dir): (listing, any Sony-style name in it)}
+
 
         # Check for required tools
         self._check_requirements()
 
+    @cached_property
+    def system_info(self):
+        """System information for the report, collected the first time it is needed"""
+        return self.collect_system_info()
+
     def collect_system_info(self):
         """Collect detailed system information"""
         system_info = {
-            "os": platform.system(),
+            "os": _SYSTEM,
             "os_version": platform.version(),
             "cpu": self._get_cpu_info(),
             "ffmpeg_version": self._get_ffmpeg_version(),
@@ -102,8 +355,7 @@ class ProxyGenerator:
         }
         
         # Test all hardware acceleration options and record results
-        for accel in self.codec_config.HW_ACCEL_MAP.get(platform.system(), []):
-            result = self.codec_config._check_ffmpeg_hw_support(accel)
+        for accel, result in self._get_tested_hw_accels().items():
             system_info["hw_accel_tested"].append({
                 "accelerator": accel,
                 "supported": result
@@ -111,16 +363,51 @@ class ProxyGenerator:
             
         return system_info
 
+    def _get_tested_hw_accels(self):
+        """Test each hardware accelerator for this OS, reusing results saved by earlier runs
+
+        Saved results are keyed by the ffmpeg executable's path and mtime, so upgrading
+        ffmpeg tests everything again.
+        """
+        cache_key = None
+        saved = {}
+        try:
+            # Fails (leaving the results unsaved) when ffmpeg was not found on PATH
+            cache_key = f"{FFMPEG}:{os.stat(FFMPEG).st_mtime_ns}"
+            with open(HWACCEL_CACHE_FILE, 'rb') as f:
+                saved = _json_loads(f.read()).get(cache_key, {})
+        except (OSError, ValueError, AttributeError):
+            saved = {}
+
+        results = {}
+        for accel in self.codec_config.HW_ACCEL_MAP.get(_SYSTEM, []):
+            if accel in saved:
+                results[accel] = saved[accel]
+            else:
+                results[accel] = self.codec_config._check_ffmpeg_hw_support(accel)
+
+        if cache_key and results != saved:
+            try:
+                HWACCEL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile(dir=HWACCEL_CACHE_FILE.parent, prefix='hwaccels.',
+                                                 suffix='.tmp', delete=False) as f:
+                    temp_file = f.name
+                    f.write(_json_dumps({cache_key: results}))
+                os.replace(temp_file, HWACCEL_CACHE_FILE)
+            except OSError:
+                pass
+        return results
+
     def _get_cpu_info(self):
         """Get CPU information"""
         try:
-            if platform.system() == "Windows":
+            if _SYSTEM == "Windows":
                 import winreg
                 key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\CentralProcessor\0")
                 return winreg.QueryValueEx(key, "ProcessorNameString")[0]
-            elif platform.system() == "Darwin":  # macOS
+            elif _SYSTEM == "Darwin":  # macOS
                 cmd = ["sysctl", "-n", "machdep.cpu.brand_string"]
-                return subprocess.check_output(cmd).decode().strip()
+                return subprocess.check_output(cmd, **SUBPROC_KW).decode().strip()
             else:  # Linux
                 with open("/proc/cpuinfo") as f:
                     for line in f:
@@ -133,9 +420,9 @@ class ProxyGenerator:
     def _get_ffmpeg_version(self):
         """Get FFmpeg version information"""
         try:
-            result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True, check=True)
+            result = subprocess.run([FFMPEG, '-version'], capture_output=True, check=True, **SUBPROC_KW)
             # Extract just the first line which contains the version
-            return result.stdout.split('\n')[0]
+            return result.stdout.decode(errors='replace').split('\n')[0]
         except Exception:
             return "Unknown"
 
@@ -178,72 +465,103 @@ class ProxyGenerator:
             for tool in missing_tools:
                 print(f"- {tool}")
             print("\nInstallation instructions:")
-            if platform.system() == 'Darwin':  # macOS
+            if _SYSTEM == 'Darwin':  # macOS
                 print("Using Homebrew:")
                 for tool in missing_tools:
                     print(f"brew install {tool}")
-            elif platform.system() == 'Windows':
+            elif _SYSTEM == 'Windows':
                 print("Using Chocolatey:")
                 for tool in missing_tools:
                     print(f"choco install {tool}")
             sys.exit(1)
 
     def _get_scaling_filter(self):
-        """Get scaling filter that maintains aspect ratio"""
-        if self.scale == "half":
-            return "scale=iw/2:ih/2"
-        return "scale=iw/4:ih/4"  # quarter
+        """Get scaling filter that maintains aspect ratio
+
+        fast_bilinear is much cheaper than swscale's default bicubic and is plenty for proxies.
+        """
+        divisor = 2 if self.scale == "half" else 4  # quarter
+        return f"scale=iw/{divisor}:ih/{divisor}:flags=fast_bilinear"
 
     def _is_mobile_footage(self, file_path):
         """Check if the footage is from a mobile or consumer device (phones, action cameras, etc.)"""
+        file_path = Path(file_path)
+        if file_path in self._mobile_cache:
+            return self._mobile_cache[file_path]
+
         try:
-            result = subprocess.run(['exiftool', '-json', file_path],
-                                    capture_output=True, text=True, check=True)
-            metadata = json.loads(result.stdout)[0]
-            
-            # Check for various mobile/consumer device indicators
-            mobile_indicators = [
-                'AndroidVersion',        # Android phones
-                'DeviceManufacturer',   # Generic device info
-                'CameraModelName',      # Check for phone camera names
-                'Make',                 # Camera manufacturer
-                'Model'                 # Camera model
-            ]
-            
-            # Common mobile device manufacturers and models
-            mobile_keywords = [
-                'android', 'samsung', 'pixel', 'oneplus', 'xiaomi', 'huawei',
-                'meta', 'ray-ban', 'osmo', 'pocket', 'gopro', 'insta360', 'action',
-                'phone', 'mobile', 'smartphone'
-            ]
-            
-            # Check for direct Android indicator (original logic)
-            if 'AndroidVersion' in metadata:
-                return True
-                
-            # Check other metadata fields for mobile device indicators
-            for field in mobile_indicators:
-                if field in metadata:
-                    value = str(metadata[field]).lower()
-                    for keyword in mobile_keywords:
-                        if keyword in value:
-                            return True
-            
-            return False
+            result = subprocess.run([EXIFTOOL, '-json', *MOBILE_METADATA_TAGS, str(file_path)],
+                                    capture_output=True, check=True, **SUBPROC_KW)
+            is_mobile = self._is_mobile_metadata(_json_loads(result.stdout)[0])
         except Exception:
-            return False
+            is_mobile = False
+
+        self._mobile_cache[file_path] = is_mobile
+        return is_mobile
+
+    def _batch_mobile_footage(self, paths):
+        """Detect mobile footage for many files at once, one exiftool call per EXIFTOOL_BATCH_SIZE files
+
+        Returns:
+            dict: {Path: bool} for every file exiftool reported on
+        """
+        batches = [paths[start:start + EXIFTOOL_BATCH_SIZE] for start in range(0, len(paths), EXIFTOOL_BATCH_SIZE)]
+        results = {}
+        if not batches:
+            return results
+        # Batches are independent, so run the exiftool processes side by side
+        with ThreadPoolExecutor(max_workers=min(len(batches), VALIDATION_WORKERS)) as executor:
+            for batch_results in executor.map(self._exiftool_mobile_batch, batches):
+                results.update(batch_results)
+        return results
+
+    def _exiftool_mobile_batch(self, batch):
+        """Run one exiftool call over a batch of files and classify each one it reports on"""
+        results = {}
+        try:
+            # No check=True: exiftool exits non-zero if any file fails but still reports the rest
+            result = subprocess.run([EXIFTOOL, '-json', *MOBILE_METADATA_TAGS, *map(str, batch)],
+                                    capture_output=True, **SUBPROC_KW)
+            for metadata in _json_loads(result.stdout or b'[]'):
+                results[Path(metadata['SourceFile'])] = self._is_mobile_metadata(metadata)
+        except Exception:
+            # Files missing from the results fall back to a per-file exiftool call
+            pass
+        return results
+
+    def _is_mobile_metadata(self, metadata):
+        """Check exiftool metadata for mobile/consumer device indicators"""
+        # Check for various mobile/consumer device indicators
+        mobile_indicators = [
+            'AndroidVersion',        # Android phones
+            'DeviceManufacturer',   # Generic device info
+            'CameraModelName',      # Check for phone camera names
+            'Make',                 # Camera manufacturer
+            'Model'                 # Camera model
+        ]
+        
+        # Check for direct Android indicator (original logic)
+        if 'AndroidVersion' in metadata:
+            return True
+            
+        # Check other metadata fields for mobile device indicators in one regex scan
+        values = '\n'.join(str(metadata[field]) for field in mobile_indicators if field in metadata)
+        return _MOBILE_RE.search(values) is not None
 
     def _is_mobile_folder(self, folder_path):
         """Check if the folder contains any file with 'is_mobile' in its name (case insensitive)"""
+        folder_path = Path(folder_path)
+        if folder_path in self._mobile_folder_cache:
+            return self._mobile_folder_cache[folder_path]
         try:
-            folder = Path(folder_path)
-            for item in folder.iterdir():
-                if 'is_mobile' in item.name.lower():
-                    return True
-            return False
+            # Shares the cached listing used for Sony proxy detection in the same folder
+            is_mobile = any('is_mobile' in stem_lower + suffix_lower
+                            for _, _, stem_lower, suffix_lower in self._scan_dir(folder_path))
         except Exception:
             # If we can't read the directory for any reason, return False
-            return False
+            is_mobile = False
+        self._mobile_folder_cache[folder_path] = is_mobile
+        return is_mobile
 
     def _detect_sony_proxy_pair(self, video_path):
         """Detect if this video file has a corresponding Sony camera proxy in the same directory.
@@ -265,13 +583,12 @@ class ProxyGenerator:
         
         # Check if current file appears to be a Sony proxy (has suffix pattern like S03, S02, etc.)
         # Use regex to check for suffix pattern: ends with S followed by digits
-        import re
-        proxy_pattern = re.compile(r'S\d+$')
+        proxy_pattern = _SONY_PROXY_RE
         
         if proxy_pattern.search(base_name):
             # This appears to be a proxy file
             # Extract the original base name by removing the S## suffix
-            original_base_name = re.sub(r'S\d+$', '', base_name)
+            original_base_name = proxy_pattern.sub('', base_name)
             original_path = parent_dir / f"{original_base_name}{extension}"
             
             if original_path.exists() and original_path != video_path:
@@ -286,20 +603,21 @@ class ProxyGenerator:
             proxy_candidates = []
             
             # Look for files that start with the same base name and have S## suffix
-            for file in parent_dir.iterdir():
-                if (file.is_file() and 
-                    file.suffix.lower() == extension.lower() and
-                    file.stem.startswith(base_name) and
-                    proxy_pattern.search(file.stem) and
-                    file != video_path):
-                    proxy_candidates.append(file)
+            extension_lower = extension.lower()
+            for entry, entry_stem, _, entry_suffix_lower in self._scan_dir(parent_dir):
+                if (entry_suffix_lower == extension_lower and
+                    entry.is_file() and
+                    entry_stem.startswith(base_name) and
+                    proxy_pattern.search(entry_stem) and
+                    entry.name != video_path.name):
+                    proxy_candidates.append(entry)
             
             # Return the first valid proxy found (there might be multiple S01, S02, S03 etc.)
             for proxy_candidate in proxy_candidates:
                 # Additional validation: proxy should be smaller than original
                 try:
                     if proxy_candidate.stat().st_size < video_path.stat().st_size:
-                        return True, proxy_candidate, video_path
+                        return True, Path(proxy_candidate.path), video_path
                 except OSError:
                     continue
             
@@ -327,25 +645,30 @@ class ProxyGenerator:
         extension = video_path.suffix
 
         # Look for Sony proxy pattern: {base_name}S##.{extension}
-        import re
-        proxy_pattern = re.compile(r'S\d+$')
+        proxy_pattern = _SONY_PROXY_RE
+
+        # Most shoots have no Sony proxies at all; skip the per-video match for those folders
+        entries = self._scan_dir(proxies_dir)
+        if not self._has_sony_proxies(proxies_dir, entries):
+            return None
 
         sony_proxy_candidates = []
 
-        for file in proxies_dir.iterdir():
-            if (file.is_file() and
-                file.suffix.lower() == extension.lower() and
-                file.stem.startswith(base_name) and
-                proxy_pattern.search(file.stem) and
-                file != video_path):
-                sony_proxy_candidates.append(file)
+        extension_lower = extension.lower()
+        for entry, entry_stem, _, entry_suffix_lower in entries:
+            if (entry_suffix_lower == extension_lower and
+                entry.is_file() and
+                entry_stem.startswith(base_name) and
+                proxy_pattern.search(entry_stem) and
+                entry.path != str(video_path)):
+                sony_proxy_candidates.append(entry)
 
         # Validate and return the first valid Sony proxy
         for candidate in sony_proxy_candidates:
             try:
                 # Verify it's smaller than the original (should be a proxy)
                 if candidate.stat().st_size < video_path.stat().st_size:
-                    return candidate
+                    return Path(candidate.path)
             except OSError:
                 continue
 
@@ -364,65 +687,261 @@ class ProxyGenerator:
         if not self.GENERAL_PROXIES_DIR.exists():
             return None
 
-        video_path = Path(video_path)
-        base_name = video_path.stem.lower()
+        base_name = Path(video_path).stem.lower()
+        _, by_base = self._get_general_proxy_index()
 
-        for file in self.GENERAL_PROXIES_DIR.iterdir():
-            if not file.is_file():
-                continue
+        # Standard (basename_proxy) and Sony (basenameS##) candidates, in listing order
+        for candidate in by_base.get(base_name, ()):
+            st = self._try_stat(candidate)
+            if self._quick_proxy_sanity(st) and self._is_proxy_valid(candidate, st):
+                return candidate
 
-            file_stem_lower = file.stem.lower()
+        return None
 
-            # Check standard proxy naming: basename_proxy
-            if file_stem_lower == f"{base_name}_proxy":
-                if self._is_proxy_valid(file):
-                    return file
+    def _has_sony_proxies(self, proxies_dir, entries):
+        """Whether a proxies folder listing contains any Sony-style S## file, cached per listing"""
+        key = os.fspath(proxies_dir)
+        seen = self._sony_seen.get(key)
+        if seen is None or seen[0] is not entries:
+            seen = self._sony_seen[key] = (entries, any(_SONY_PROXY_RE.search(stem) for _, stem, _, _ in entries))
+        return seen[1]
 
-            # Check Sony proxy naming: basenameS## (e.g., 20260115_ze12266S03)
-            sony_pattern = re.compile(rf'^{re.escape(base_name)}s\d+$', re.IGNORECASE)
-            if sony_pattern.match(file_stem_lower):
-                if self._is_proxy_valid(file):
-                    return file
+    def _get_general_proxy_index(self):
+        """Index the general proxies folder by the lowercased source base name each proxy names
 
-        return None
+        Both <basename>_proxy and Sony <basename>S## files are listed under basename,
+        keeping every match in listing order. Built from one listing and reused for
+        every video until the folder changes.
+        """
+        entries = self._scan_dir(self.GENERAL_PROXIES_DIR)
+        index = self._general_proxy_index
+        # Rebuild whenever the folder was listed again
+        if index is None or index[0] is not entries:
+            by_base = defaultdict(list)
+            for entry, _, stem_lower, _ in entries:
+                if not entry.is_file():
+                    continue
+                if stem_lower.endswith('_proxy'):
+                    by_base[stem_lower[:-len('_proxy')]].append(Path(entry.path))
+                elif _SONY_PROXY_ANYCASE_RE.search(stem_lower):
+                    by_base[_SONY_PROXY_ANYCASE_RE.sub('', stem_lower)].append(Path(entry.path))
+            index = self._general_proxy_index = (entries, by_base)
+        return index
+
+    def _scan_dir(self, dir_path):
+        """List a directory once and return cached (DirEntry, stem, stem_lower, suffix_lower) tuples
+
+        The listing is reused until the directory's mtime changes, so a single stat
+        replaces a rescan. DirEntry caches is_file() from the directory read and stat()
+        after its first call, and names are split and lowercased once per listing, so
+        sibling files share that work instead of redoing it per lookup.
+        """
+        key = os.fspath(dir_path)
+        mtime_ns = os.stat(key).st_mtime_ns
+        with self._dir_cache_lock:
+            cached = self._dir_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        entries = []
+        with os.scandir(key) as it:
+            for entry in it:
+                stem, suffix = os.path.splitext(entry.name)
+                entries.append((entry, stem, stem.lower(), suffix.lower()))
+        entries = tuple(entries)
+        with self._dir_cache_lock:
+            self._dir_cache[key] = (mtime_ns, entries)
+        return entries
+
+    def _invalidate_dir(self, *dir_paths):
+        """Drop cached listings for directories whose contents were changed"""
+        with self._dir_cache_lock:
+            for dir_path in dir_paths:
+                self._dir_cache.pop(os.fspath(dir_path), None)
+
+    def _source_stat(self, video_path):
+        """Stat a source found by the walk through its DirEntry
+
+        DirEntry caches its stat (and gets it from the directory read on Windows), so the
+        conflict scan's up-to-date check and probe prefetch share a single stat per source.
+        """
+        return self._try_stat(self._source_entries.get(video_path, video_path))
+
+    def _try_stat(self, path):
+        """Stat a path or os.DirEntry, returning None if it doesn't exist or can't be read
 
-    def _is_proxy_valid(self, proxy_path):
-        """Check if existing proxy is valid"""
-        self._log(f"Validating proxy file: {proxy_path}")
+        Replaces an exists() check followed by a second stat: one syscall answers both.
+        """
         try:
-            # Use a more detailed ffprobe to verify the file is fully valid
-            cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-select_streams', 'v:0',
-                '-show_entries', 'stream=width,height,codec_name',
-                '-of', 'json',
-                str(proxy_path)
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
+            return path.stat() if isinstance(path, os.DirEntry) else os.stat(path)
+        except OSError:
+            return None
+
+    def _is_proxy_valid(self, proxy_path, st=None):
+        """Check if existing proxy is valid, memoized on the proxy's mtime and size
+
+        Pass st when the caller already has the proxy's stat result.
+        """
+        if st is None:
+            try:
+                st = os.stat(proxy_path)
+            except OSError as e:
+                self._log(f"Proxy validation failed: {proxy_path}\nError: {str(e)}", logging.WARNING)
+                return False
+
+        cache_key = (str(proxy_path), st.st_mtime_ns, st.st_size)
+        if cache_key not in self._proxy_valid_cache:
+            valid = self._proxy_valid_cache[cache_key] = self._probe_proxy_validity(proxy_path)
+            if valid:
+                self._remember_proxy(proxy_path, st)
+        return self._proxy_valid_cache[cache_key]
+
+    def _remember_proxy(self, proxy_path, st):
+        """Record a proxy this tool wrote or validated, so later runs can trust it by mtime"""
+        with self._cache_lock:
+            self._known_proxies[str(proxy_path)] = [st.st_mtime_ns, st.st_size]
+
+    def _is_known_proxy(self, proxy_path, st):
+        """Whether a proxy is unchanged since this tool wrote or validated it"""
+        with self._cache_lock:
+            entry = self._known_proxies.get(str(proxy_path))
+        return entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size
+
+    def _quick_proxy_sanity(self, st):
+        """Cheap pre-check before ffprobe on a proxy's stat result (None if missing)
+
+        Rejects only missing and empty proxies. A short low-resolution proxy can be a few
+        KB, so small files still go to ffprobe rather than being treated as absent. There
+        is no upper bound relative to the source either; ProRes/DNxHR proxies of long-GOP
+        footage are routinely larger than the original.
+        """
+        return st is not None and st.st_size > 0
+
+    def _probe_proxy_validity(self, proxy_path):
+        """Run ffprobe to check that a proxy has a readable video stream"""
+        self.log.info("Validating proxy file: %s", proxy_path)
+        try:
+            cmd = VALIDATE_PROBE_ARGS + (os.fspath(proxy_path),)
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    timeout=10, **SUBPROC_KW)
+
+            if result.returncode != 0:
+                self._log(f"Proxy validation failed: {proxy_path}\nError: {result.stderr.decode(errors='replace')}", logging.WARNING)
+                return False
 
             # Check if we got valid video stream data
-            if 'streams' in data and len(data['streams']) > 0:
-                self._log(f"Proxy validation successful: {proxy_path}")
+            if b'video' in result.stdout:
+                self.log.info("Proxy validation successful: %s", proxy_path)
                 return True
             else:
                 self._log(f"Proxy has no valid video streams: {proxy_path}")
                 return False
 
-        except subprocess.CalledProcessError as e:
-            self._log(f"Proxy validation failed: {proxy_path}\nError: {e.stderr}")
+        except Exception as e:
+            self._log(f"Proxy validation failed with unexpected error: {proxy_path}\nError: {str(e)}", logging.WARNING)
             return False
-        except json.JSONDecodeError:
-            self._log(f"Proxy validation failed: Invalid JSON from ffprobe for {proxy_path}")
+
+    def _is_proxy_up_to_date(self, proxy_path, video_path, proxy_st=None, video_st=None):
+        """Check if a proxy was written after its source was last modified.
+
+        Only proxies this tool wrote or validated, and that are unchanged since, are
+        trusted this way; anything else (e.g. a truncated file left by an older version
+        that wrote to the final path) is left to _is_proxy_valid. Stat results the
+        caller already holds are reused.
+        """
+        proxy_st = proxy_st or self._try_stat(proxy_path)
+        if proxy_st is None or not self._is_known_proxy(proxy_path, proxy_st):
             return False
-        except Exception as e:
-            self._log(f"Proxy validation failed with unexpected error: {proxy_path}\nError: {str(e)}")
+        video_st = video_st or self._try_stat(video_path)
+        if video_st is None:
             return False
+        return proxy_st.st_mtime >= video_st.st_mtime
 
-    def _get_file_size(self, path):
-        """Get file size in MB"""
-        return os.path.getsize(path) / (1024 * 1024)
+    def _load_cache(self):
+        """Load the persistent cache sidecar, returning an empty cache if missing or unreadable"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self):
+        """Write the persistent cache sidecar for the next run"""
+        with self._cache_lock:
+            cache = {
+                'fingerprints': {key: str(path) for key, path in self._fingerprints.items() if os.path.exists(path)},
+                'probes': {path: entry for path, entry in self._probe_cache.items() if os.path.exists(path)},
+                'proxies': {path: entry for path, entry in self._known_proxies.items() if os.path.exists(path)}
+            }
+        # A unique temp file per write, so overlapping saves never share a partial file
+        try:
+            with tempfile.NamedTemporaryFile(dir=self.cache_file.parent, prefix='proxy_cache.',
+                                             suffix='.tmp', delete=False) as f:
+                temp_file = f.name
+                f.write(_json_dumps(cache))
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            self._log(f"Warning: Could not save cache file {self.cache_file}: {str(e)}", logging.WARNING)
+
+    def _fingerprint(self, path):
+        """Fingerprint a file from its size and the first/last MiB of its content.
+
+        Cheap enough to run before every transcode, and catches renamed or moved copies
+        of the same source that path-based checks miss.
+        """
+        size = os.path.getsize(path)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(size.to_bytes(8, 'little'))
+        with open(path, 'rb') as f:
+            digest.update(f.read(FINGERPRINT_CHUNK_BYTES))
+            if size > FINGERPRINT_CHUNK_BYTES:
+                f.seek(-FINGERPRINT_CHUNK_BYTES, os.SEEK_END)
+                digest.update(f.read(FINGERPRINT_CHUNK_BYTES))
+        return digest.digest()
+
+    def _fast_move(self, source, target):
+        """Move a file with a single rename, copying only when it crosses filesystems"""
+        try:
+            os.replace(source, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(source, target)
+
+    def _link_or_copy(self, source, target):
+        """Hardlink target to source, copying instead when linking is not possible"""
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
+    def _get_file_size(self, path, st=None):
+        """Get file size in MB, from an existing stat result when the caller has one"""
+        if st is None:
+            st = os.stat(path)
+        return st.st_size / (1024 * 1024)
+
+    def _get_worker_count(self):
+        """Get the number of concurrent ffmpeg processes actually used"""
+        if not self.parallel:
+            return 1
+        return self.max_workers or default_worker_count(self.concurrency_profile)
+
+    def _ffmpeg_threads_per_invocation(self):
+        """Get the -threads value for each ffmpeg so concurrent workers share the CPU
+
+        Without a cap every ffmpeg sizes its thread pool to the whole machine, so N workers
+        oversubscribe the CPU N times over. An explicit value (argument, then the
+        PROXY_FFMPEG_THREADS env var) wins over splitting the cores across workers.
+        """
+        threads = self.ffmpeg_threads
+        if threads is None and os.environ.get(FFMPEG_THREADS_ENV):
+            try:
+                threads = int(os.environ[FFMPEG_THREADS_ENV])
+            except ValueError:
+                print(f"Warning: Ignoring invalid {FFMPEG_THREADS_ENV}={os.environ[FFMPEG_THREADS_ENV]!r}")
+        if threads is None:
+            threads = (os.cpu_count() or self._get_worker_count()) // self._get_worker_count()
+        return max(1, min(threads, MAX_FFMPEG_THREADS))
 
     def _get_proxies_dir(self, video_path):
         """Get the parent proxies directory"""
@@ -443,13 +962,15 @@ class ProxyGenerator:
         proxies_dir = expected_proxy_path.parent
         base_name = f"{video_path.stem}_proxy"
         
+        base_name_lower = base_name.lower()
+        expected_name = expected_proxy_path.name
+
         # Look for any proxy with the same base name but different extension
-        for file in proxies_dir.iterdir():
-            if (file.is_file() and 
-                file.stem.lower() == base_name.lower() and 
-                file != expected_proxy_path and
-                self._is_proxy_valid(file)):
-                return file
+        for entry, _, stem_lower, _ in self._scan_dir(proxies_dir):
+            if stem_lower == base_name_lower and entry.name != expected_name and entry.is_file():
+                st = self._try_stat(entry)
+                if self._quick_proxy_sanity(st) and self._is_proxy_valid(Path(entry.path), st):
+                    return Path(entry.path)
         return None
 
     def _prompt_user_for_duplicate_proxy(self, video_path, existing_proxy_path, new_proxy_path):
@@ -500,30 +1021,39 @@ class ProxyGenerator:
     def _scan_for_conflicts(self, video_files):
         """Scan for duplicate proxy conflicts before processing starts"""
         conflicts = []
-        
-        for video_path in video_files:
-            video_path = Path(video_path)
-            
-            # Get the parent proxies directory
-            proxies_dir = self._get_proxies_dir(video_path)
-            
-            # Determine if this is mobile/consumer footage - either by metadata or folder indicator
-            is_mobile_metadata = self._is_mobile_footage(video_path)
-            is_mobile_folder = self._is_mobile_folder(video_path.parent)
-            is_mobile = is_mobile_metadata or is_mobile_folder
-            
-            selected_codec = "h264" if is_mobile else self.codec_config.selected_codec
-            
-            if selected_codec in ['prores', 'dnxhr']:
-                output_extension = '.mov'
-            else:
-                output_extension = '.mp4'
-            
-            proxy_name = f"{video_path.stem}_proxy{output_extension}"
-            proxy_path = proxies_dir / proxy_name
-            
+        transcode_candidates = []
+        video_files = [Path(path) for path in video_files]
+
+        # Stage 1: check each source folder for the is_mobile marker once, folders in parallel
+        folders = list({video_path.parent for video_path in video_files})
+        if len(folders) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(folders), VALIDATION_WORKERS)) as executor:
+                list(executor.map(self._is_mobile_folder, folders))
+
+        # Stage 2: read device metadata for every file in a few concurrent exiftool calls
+        self._mobile_cache.update(self._batch_mobile_footage(video_files))
+
+        # Stage 3: decide codec and proxy location per file from the answers above
+        plans = {video_path: self._plan_file(video_path) for video_path in video_files}
+        # Stat each expected proxy once; known proxies newer than their source need no further checks
+        expected_proxies = []
+        for video_path, plan in plans.items():
+            proxy_path = plan['proxy_path']
+            proxy_st = self._try_stat(proxy_path)
+            if not self._is_proxy_up_to_date(proxy_path, video_path, proxy_st, self._source_stat(video_path)):
+                expected_proxies.append((video_path, proxy_path, proxy_st))
+
+        # Validate existing proxies that can't be trusted by mtime concurrently; the
+        # results land in the validation cache used below and again in _process_file
+        to_validate = [(proxy_path, proxy_st) for _, proxy_path, proxy_st in expected_proxies
+                       if self._quick_proxy_sanity(proxy_st)]
+        if len(to_validate) > 1:
+            with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS) as executor:
+                list(executor.map(self._is_proxy_valid, *zip(*to_validate)))
+
+        for video_path, proxy_path, proxy_st in expected_proxies:
             # Skip if exact proxy already exists
-            if proxy_path.exists() and self._is_proxy_valid(proxy_path):
+            if self._quick_proxy_sanity(proxy_st) and self._is_proxy_valid(proxy_path, proxy_st):
                 continue
 
             # Skip if proxy exists in centralized general proxies folder
@@ -538,8 +1068,43 @@ class ProxyGenerator:
                     'existing_proxy': existing_different_proxy,
                     'new_proxy': proxy_path
                 })
+            else:
+                transcode_candidates.append(video_path)
+
+        # Probe files that will need transcoding now, concurrently, rather than one by one later
+        self._prefetch_probes(transcode_candidates)
+        
+        return conflicts, plans
+
+    def _plan_file(self, video_path):
+        """Decide the mobile override, codec and proxy location for a file
+
+        Computed once per file during the conflict scan and reused by _prepare_file.
+        """
+        # Get the parent proxies directory
+        proxies_dir = self._get_proxies_dir(video_path)
+        
+        # Determine if this is mobile/consumer footage - either by metadata or folder indicator
+        is_mobile_metadata = self._is_mobile_footage(video_path)
+        is_mobile_folder = self._is_mobile_folder(video_path.parent)
+        is_mobile = is_mobile_metadata or is_mobile_folder
         
-        return conflicts
+        selected_codec = "h264" if is_mobile else self.codec_config.selected_codec
+        
+        if selected_codec in ['prores', 'dnxhr']:
+            output_extension = '.mov'
+        else:
+            output_extension = '.mp4'
+        
+        return {
+            'is_mobile_metadata': is_mobile_metadata,
+            'is_mobile_folder': is_mobile_folder,
+            'is_mobile': is_mobile,
+            'selected_codec': selected_codec,
+            'output_ext': output_extension,
+            'proxies_dir': proxies_dir,
+            'proxy_path': proxies_dir / f"{video_path.stem}_proxy{output_extension}"
+        }
 
     def _resolve_conflicts_upfront(self, conflicts):
         """Resolve all conflicts with user input before processing starts"""
@@ -553,6 +1118,15 @@ class ProxyGenerator:
             print(f"\n⏭️  Auto-skipping {len(conflicts)} videos with existing proxies (--skip-existing enabled)")
             return
 
+        # Probe the conflicting files in the background while the user answers the prompts,
+        # so the ones they choose to re-transcode are already cached
+        prefetch = threading.Thread(
+            target=self._prefetch_probes,
+            args=([conflict['video_path'] for conflict in conflicts],),
+            daemon=True
+        )
+        prefetch.start()
+
         print(f"\n🎯 Found {len(conflicts)} proxy conflicts that need your decision:")
         print("=" * 60)
         
@@ -577,25 +1151,97 @@ class ProxyGenerator:
                     self.conflict_decisions[str(remaining_conflict['video_path'])] = 'skip'
                 break
         
+        prefetch.join()
         print("\n✅ All conflicts resolved! Starting processing...")
 
     def _process_file(self, video_path):
         """Process a single video file"""
+        job = self._prepare_file(video_path)
+        if job and not self._link_prepared_duplicate(job):
+            start_time = time.time()
+            tail = deque(maxlen=STDERR_TAIL_CHUNKS)
+            with subprocess.Popen(job['cmd'], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, **SUBPROC_KW) as proc:
+                # stderr is the only pipe, so draining it here can't deadlock
+                for chunk in iter(lambda: proc.stderr.read(STDERR_CHUNK_BYTES), b''):
+                    tail.append(chunk)
+            self._finish_transcode(job, proc.returncode, self._stderr_tail(proc.returncode, tail), time.time() - start_time)
+
+    def _stderr_tail(self, returncode, tail):
+        """Decode the kept stderr tail, which is only reported when ffmpeg failed"""
+        return b''.join(tail).decode(errors='replace') if returncode else ''
+
+    async def _transcode_async(self, job, semaphore):
+        """Run one prepared transcode, awaiting ffmpeg on the event loop instead of a blocked thread"""
+        async with semaphore:
+            if self._link_prepared_duplicate(job):
+                return
+            start_time = time.time()
+            proc = await asyncio.create_subprocess_exec(
+                *job['cmd'],
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            tail = deque(maxlen=STDERR_TAIL_CHUNKS)
+            while chunk := await proc.stderr.read(STDERR_CHUNK_BYTES):
+                tail.append(chunk)
+            await proc.wait()
+            self._finish_transcode(job, proc.returncode, self._stderr_tail(proc.returncode, tail), time.time() - start_time)
+
+    async def _transcode_all_async(self, video_files, max_workers):
+        """Prepare files and start each one's transcode as soon as it is prepared
+
+        Everything before ffmpeg waits on stat/readdir/probes, so files are prepared in a
+        wide thread pool while earlier files encode; only the transcodes are limited to
+        max_workers ffmpeg processes in flight. On interrupt, queued preparations are
+        cancelled instead of run to completion.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_workers)
+        executor = ThreadPoolExecutor(max_workers=VALIDATION_WORKERS)
+        try:
+            prepares = [loop.run_in_executor(executor, self._prepare_file, video_file) for video_file in video_files]
+            transcodes = []
+            for prepared in asyncio.as_completed(prepares):
+                job = await prepared
+                if job:
+                    transcodes.append(asyncio.create_task(self._transcode_async(job, semaphore)))
+            await asyncio.gather(*transcodes)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _prepare_file(self, video_path):
+        """Handle a file up to the point of transcoding
+
+        Returns:
+            dict with the ffmpeg command and output paths when the file needs transcoding,
+            None when it was skipped, moved, linked or failed
+        """
         video_path = Path(video_path)
-        self._log(f"Processing file: {video_path}")
+        # String form built once for stat, the report and the ffmpeg command; name parts
+        # are reused by the log lines and proxy name matching below
+        video_path_s = os.fspath(video_path)
+        video_name = video_path.name
+        video_stem = video_path.stem
+        video_stem_lower = video_stem.lower()
+        self.log.info("Processing file: %s", video_path_s)
 
         # Check if file still exists (may have been moved by another thread in parallel processing)
-        if not video_path.exists():
-            self._log(f"File no longer exists (likely moved by another thread): {video_path.name}")
+        try:
+            video_st = os.stat(video_path_s)
+        except FileNotFoundError:
+            self._log(f"File no longer exists (likely moved by another thread): {video_name}")
             return
 
+        # Codec and proxy location decided during the conflict scan
+        plan = self._plans.get(video_path) or self._plan_file(video_path)
+
         # Check for Sony camera proxy pairs first
         is_original, sony_proxy_path, sony_original_path = self._detect_sony_proxy_pair(video_path)
         
         # Create a details dictionary for this file
         file_details = {
-            "filename": str(video_path),
-            "size_mb": self._get_file_size(video_path),
+            "filename": video_path_s,
+            "size_mb": self._get_file_size(video_path, video_st),
             "processing_start": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "result": "pending",
             "codec_decision": {},
@@ -606,9 +1252,10 @@ class ProxyGenerator:
         # Handle Sony proxy optimization
         if sony_proxy_path and is_original:
             # This is an original file with a Sony proxy - use the existing proxy
-            self._log(f"📷 SONY PROXY DETECTED: {video_path.name}")
-            self._log(f"   Original: {sony_original_path.name} ({self._get_file_size(sony_original_path):.1f}MB)")
-            self._log(f"   Sony proxy: {sony_proxy_path.name} ({self._get_file_size(sony_proxy_path):.1f}MB)")
+            self._log(f"📷 SONY PROXY DETECTED: {video_name}")
+            sony_proxy_size = self._get_file_size(sony_proxy_path)
+            self._log(f"   Original: {sony_original_path.name} ({file_details['size_mb']:.1f}MB)")
+            self._log(f"   Sony proxy: {sony_proxy_path.name} ({sony_proxy_size:.1f}MB)")
             
             # Thread-safe Sony proxy processing
             with self.sony_proxy_lock:
@@ -621,17 +1268,17 @@ class ProxyGenerator:
                     file_details["result"] = "skipped"
                     file_details["skip_reason"] = "Sony proxy already processed by another thread"
                     file_details["processing_end"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    self.processed_files_details.append(file_details)
+                    self._record_details(file_details)
                     return
                 
                 # Mark this Sony proxy as being processed
                 self.processed_sony_proxies.add(sony_proxy_str)
             
             # Get the parent proxies directory
-            proxies_dir = self._get_proxies_dir(video_path)
+            proxies_dir = plan['proxies_dir']
             
             # Generate the target proxy name (Premiere Pro compatible)
-            proxy_name = f"{video_path.stem}_proxy{video_path.suffix}"
+            proxy_name = f"{video_stem}_proxy{video_path.suffix}"
             target_proxy_path = proxies_dir / proxy_name
             
             try:
@@ -648,55 +1295,63 @@ class ProxyGenerator:
                     file_details["result"] = "skipped"
                     file_details["skip_reason"] = "Sony proxy already moved by another thread"
                 else:
-                    # Safer copy-then-delete approach for Sony proxies
-                    shutil.copy2(sony_proxy_path, target_proxy_path)  # Copy with metadata
-                    
-                    # Verify the copy was successful before deleting
-                    if target_proxy_path.exists() and target_proxy_path.stat().st_size > 0:
-                        sony_proxy_path.unlink()  # Delete the original
-                        self._log(f"✅ SONY PROXY MOVED: {sony_proxy_path.name} → {target_proxy_path.name}")
-                        self._log(f"   Location: {proxies_dir}")
+                    try:
+                        # Same filesystem: a rename is a metadata-only move
+                        os.rename(sony_proxy_path, target_proxy_path)
+                    except OSError:
+                        # Cross-device: safer copy-then-delete approach for Sony proxies
+                        shutil.copy2(sony_proxy_path, target_proxy_path)  # Copy with metadata
                         
-                        self.stats['moved'] += 1
-                        self.stats['sony_proxies_moved'] += 1
-                        file_details["result"] = "sony_proxy_moved"
-                        file_details["sony_proxy_source"] = str(sony_proxy_path)
-                        file_details["sony_proxy_target"] = str(target_proxy_path)
-                        file_details["sony_proxy_size_mb"] = self._get_file_size(target_proxy_path)
-                    else:
-                        # Copy failed, clean up and log error
-                        if target_proxy_path.exists():
-                            target_proxy_path.unlink()  # Remove incomplete copy
-                        raise Exception(f"Copy verification failed - target file is missing or empty")
+                        # Verify the copy was successful before deleting
+                        if target_proxy_path.exists() and target_proxy_path.stat().st_size > 0:
+                            sony_proxy_path.unlink()  # Delete the original
+                        else:
+                            # Copy failed, clean up and log error
+                            if target_proxy_path.exists():
+                                target_proxy_path.unlink()  # Remove incomplete copy
+                                self._invalidate_dir(proxies_dir)
+                            raise Exception(f"Copy verification failed - target file is missing or empty")
+                    
+                    self._invalidate_dir(sony_proxy_path.parent, proxies_dir)
+                    self._log(f"✅ SONY PROXY MOVED: {sony_proxy_path.name} → {target_proxy_path.name}")
+                    self._log(f"   Location: {proxies_dir}")
+                    
+                    self.stats['moved'] += 1
+                    self.stats['sony_proxies_moved'] += 1
+                    file_details["result"] = "sony_proxy_moved"
+                    file_details["sony_proxy_source"] = str(sony_proxy_path)
+                    file_details["sony_proxy_target"] = str(target_proxy_path)
+                    file_details["sony_proxy_size_mb"] = sony_proxy_size
                     
             except Exception as e:
-                self._log(f"❌ Error moving Sony proxy: {str(e)}")
+                self._log(f"❌ Error moving Sony proxy: {str(e)}", logging.ERROR)
                 file_details["result"] = "error"
                 file_details["error"] = f"Error moving Sony proxy: {str(e)}"
             
             file_details["processing_end"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.processed_files_details.append(file_details)
+            self._record_details(file_details)
             return
             
         elif not is_original:
             # This is a Sony proxy file itself - skip it since we'll handle it via the original
-            self._log(f"📷 SKIPPING SONY PROXY FILE: {video_path.name} (will be handled via original)")
+            self._log(f"📷 SKIPPING SONY PROXY FILE: {video_name} (will be handled via original)")
             self.stats['skipped'] += 1
             file_details["result"] = "skipped"
             file_details["skip_reason"] = "Sony proxy file - handled via original file"
             file_details["processing_end"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.processed_files_details.append(file_details)
+            self._record_details(file_details)
             return
 
         # Check centralized general proxies folder first
         general_proxy = self._find_proxy_in_general_folder(video_path)
         if general_proxy:
-            proxies_dir = self._get_proxies_dir(video_path)
+            proxies_dir = plan['proxies_dir']
 
             # Determine target filename - rename Sony format to standard _proxy format
-            if re.match(rf'^{re.escape(video_path.stem)}s\d+$', general_proxy.stem, re.IGNORECASE):
+            sony_suffix = _SONY_PROXY_ANYCASE_RE.search(general_proxy.stem)
+            if sony_suffix and general_proxy.stem[:sony_suffix.start()].lower() == video_stem_lower:
                 # Sony format proxy - rename to standard format
-                target_name = f"{video_path.stem}_proxy{general_proxy.suffix}"
+                target_name = f"{video_stem}_proxy{general_proxy.suffix}"
             else:
                 # Already standard format
                 target_name = general_proxy.name
@@ -704,7 +1359,8 @@ class ProxyGenerator:
             target_path = proxies_dir / target_name
 
             # Check if target already exists
-            if target_path.exists() and self._is_proxy_valid(target_path):
+            target_st = self._try_stat(target_path)
+            if target_st and self._is_proxy_valid(target_path, target_st):
                 self._log(f"Proxy already exists at target: {target_path}")
                 self.stats['skipped'] += 1
                 file_details["result"] = "skipped"
@@ -713,35 +1369,36 @@ class ProxyGenerator:
                 try:
                     self._log(f"📦 GENERAL FOLDER PROXY FOUND: {general_proxy.name}")
                     self._log(f"   Moving: {general_proxy} -> {target_path}")
-                    shutil.move(str(general_proxy), str(target_path))
+                    self._fast_move(general_proxy, target_path)
+                    self._invalidate_dir(self.GENERAL_PROXIES_DIR, proxies_dir)
                     self.stats['moved'] += 1
                     file_details["result"] = "moved"
                     file_details["moved_from"] = str(general_proxy)
                     file_details["moved_to"] = str(target_path)
                     self._log(f"✅ PROXY MOVED FROM GENERAL FOLDER: {target_path.name}")
                 except Exception as e:
-                    self._log(f"❌ Error moving proxy from general folder: {e}")
+                    self._log(f"❌ Error moving proxy from general folder: {e}", logging.ERROR)
                     file_details["result"] = "error"
                     file_details["error"] = str(e)
 
             file_details["processing_end"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            self.processed_files_details.append(file_details)
+            self._record_details(file_details)
             return
 
         # Get the parent proxies directory
-        proxies_dir = self._get_proxies_dir(video_path)
-        self._log(f"Using parent proxies directory: {proxies_dir}")
+        proxies_dir = plan['proxies_dir']
+        self.log.info("Using parent proxies directory: %s", proxies_dir)
 
-        # Determine if this is mobile/consumer footage - either by metadata or folder indicator
-        is_mobile_metadata = self._is_mobile_footage(video_path)
-        is_mobile_folder = self._is_mobile_folder(video_path.parent)
-        is_mobile = is_mobile_metadata or is_mobile_folder
+        # Mobile/consumer footage - either by metadata or folder indicator
+        is_mobile_metadata = plan['is_mobile_metadata']
+        is_mobile_folder = plan['is_mobile_folder']
+        is_mobile = plan['is_mobile']
         
         file_details["is_mobile_footage"] = is_mobile
         file_details["mobile_detection_method"] = "metadata" if is_mobile_metadata else ("folder indicator" if is_mobile_folder else "none")
 
         # Get codec extension based on selection (or mobile footage override)
-        selected_codec = "h264" if is_mobile else self.codec_config.selected_codec
+        selected_codec = plan['selected_codec']
         file_details["codec_decision"]["requested_codec"] = self.codec_config.selected_codec
         file_details["codec_decision"]["actual_codec"] = selected_codec
         
@@ -752,7 +1409,7 @@ class ProxyGenerator:
             
             # Log the codec override to console/log file
             if self.codec_config.selected_codec != "h264":
-                self._log(f"📱 CODEC OVERRIDE: {video_path.name}")
+                self._log(f"📱 CODEC OVERRIDE: {video_name}")
                 self._log(f"   Original codec: {self.codec_config.selected_codec.upper()}")
                 self._log(f"   Override reason: Mobile footage detected via {detection_method}")
                 self._log(f"   Using codec: H.264 (prevents VFR stuttering)")
@@ -761,16 +1418,12 @@ class ProxyGenerator:
         else:
             file_details["codec_decision"]["reason"] = "Using user-selected codec"
 
-        if selected_codec in ['prores', 'dnxhr']:
-            output_extension = '.mov'
-        else:
-            output_extension = '.mp4'
+        output_extension = plan['output_ext']
 
         file_details["output_extension"] = output_extension
         file_details["hw_acceleration"] = self.codec_config.hw_acceleration or "None"
 
-        proxy_name = f"{video_path.stem}_proxy{output_extension}"
-        proxy_path = proxies_dir / proxy_name
+        proxy_path = plan['proxy_path']
 
         # Check if a Sony proxy was manually copied to the proxies folder
         sony_proxy_in_proxies = self._find_sony_proxy_in_proxies_folder(video_path, proxies_dir)
@@ -787,7 +1440,8 @@ class ProxyGenerator:
                     self._log(f"   Renaming to standard format: {proxy_path.name}")
 
                     # Rename the Sony proxy to the standard naming convention
-                    sony_proxy_in_proxies.rename(proxy_path)
+                    self._fast_move(sony_proxy_in_proxies, proxy_path)
+                    self._invalidate_dir(proxies_dir)
 
                     self._log(f"✅ SONY PROXY RENAMED: {sony_proxy_in_proxies.name} → {proxy_path.name}")
                     self._log(f"   Location: {proxies_dir}")
@@ -799,21 +1453,31 @@ class ProxyGenerator:
                     file_details["sony_proxy_target"] = str(proxy_path)
                     file_details["sony_proxy_size_mb"] = self._get_file_size(proxy_path)
                     file_details["processing_end"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    self.processed_files_details.append(file_details)
+                    self._record_details(file_details)
                     return
 
                 except Exception as e:
-                    self._log(f"❌ Error renaming Sony proxy: {str(e)}")
+                    self._log(f"❌ Error renaming Sony proxy: {str(e)}", logging.ERROR)
                     self._log(f"   Will proceed with normal flow")
                     # Continue with normal flow if rename fails
 
-        # First, check if the proxy already exists in the parent proxies directory
-        if proxy_path.exists() and self._is_proxy_valid(proxy_path):
+        # First, check if the proxy already exists in the parent proxies directory.
+        # A known proxy newer than its source is skipped without probing either file.
+        proxy_st = self._try_stat(proxy_path)
+        if self._is_proxy_up_to_date(proxy_path, video_path, proxy_st, video_st):
             self.stats['skipped'] += 1
-            self._log(f"Skipped {video_path.name} - valid proxy already exists in parent proxies directory")
+            self._log(f"Skipped {video_name} - proxy is newer than source")
+            file_details["result"] = "skipped"
+            file_details["skip_reason"] = "Proxy is newer than source"
+            self._record_details(file_details)
+            return
+
+        if proxy_st and self._is_proxy_valid(proxy_path, proxy_st):
+            self.stats['skipped'] += 1
+            self._log(f"Skipped {video_name} - valid proxy already exists in parent proxies directory")
             file_details["result"] = "skipped"
             file_details["skip_reason"] = "Valid proxy already exists"
-            self.processed_files_details.append(file_details)
+            self._record_details(file_details)
             return
 
         # Check for existing proxy with different extension in parent proxies directory
@@ -824,79 +1488,106 @@ class ProxyGenerator:
             if user_choice == 'skip':
                 self.stats['skipped'] += 1
                 skip_reason = "Auto-skipped - existing proxy" if self.skip_existing else "User chose to skip due to existing proxy with different extension"
-                self._log(f"Skipped {video_path.name} - {skip_reason}")
+                self._log(f"Skipped {video_name} - {skip_reason}")
                 file_details["result"] = "skipped"
                 file_details["skip_reason"] = f"{skip_reason}: {existing_different_proxy.name}"
-                self.processed_files_details.append(file_details)
+                self._record_details(file_details)
                 return
             else:
                 # User chose to create duplicate, continue with processing
-                self._log(f"Creating duplicate proxy for {video_path.name} - existing: {existing_different_proxy.name}, new: {proxy_path.name}")
+                self._log(f"Creating duplicate proxy for {video_name} - existing: {existing_different_proxy.name}, new: {proxy_path.name}")
                 file_details["duplicate_created"] = True
                 file_details["existing_proxy"] = str(existing_different_proxy)
 
         # Check for existing proxies in the old Proxies subdirectory
         old_proxies_dir = video_path.parent / 'Proxies'
         old_proxy_path = None
-
-        if old_proxies_dir.exists():
-            self._log(f"Checking for proxy in old Proxies folder: {video_path.stem}_Proxy (any extension)")
-            for file in old_proxies_dir.iterdir():
-                if file.is_file() and file.stem.lower() == f"{video_path.stem.lower()}_proxy":
+        old_proxies_entries = None
+        # A missing folder is the common case, so it is only looked for once per source folder
+        if self._old_proxies_exists.get(video_path.parent, True):
+            try:
+                old_proxies_entries = self._scan_dir(old_proxies_dir)
+            except OSError:
+                self._old_proxies_exists[video_path.parent] = False
+
+        if old_proxies_entries is not None:
+            self._log(f"Checking for proxy in old Proxies folder: {video_stem}_Proxy (any extension)")
+            old_proxy_stem = f"{video_stem_lower}_proxy"
+            for entry, _, stem_lower, _ in old_proxies_entries:
+                # Compare names before is_file() so non-matching entries cost no stat
+                if stem_lower == old_proxy_stem and entry.is_file():
+                    file = Path(entry.path)
                     self._log(f"Found potential proxy in old Proxies folder: {file}")
-                    if self._is_proxy_valid(file):
+                    if self._is_proxy_valid(file, self._try_stat(entry)):
                         old_proxy_path = file
                         break
 
         # Check for existing proxies in the same directory
         if not old_proxy_path:
             parent_dir = video_path.parent
-            base_filename = video_path.stem.lower()
-            self._log(f"Checking for proxies in same directory for: {base_filename}")
-
-            for file in parent_dir.iterdir():
-                if file.is_file():
-                    file_stem_lower = file.stem.lower()
-                    if "_proxy" in file_stem_lower and base_filename in file_stem_lower:
-                        self._log(f"Found potential proxy in same directory: {file}")
-                        if self._is_proxy_valid(file):
-                            old_proxy_path = file
-                            break
+            base_filename = video_stem_lower
+            self.log.info("Checking for proxies in same directory for: %s", base_filename)
+
+            for entry, _, file_stem_lower, _ in self._scan_dir(parent_dir):
+                if "_proxy" in file_stem_lower and base_filename in file_stem_lower and entry.is_file():
+                    file = Path(entry.path)
+                    self._log(f"Found potential proxy in same directory: {file}")
+                    if self._is_proxy_valid(file, self._try_stat(entry)):
+                        old_proxy_path = file
+                        break
 
         # If proxy exists elsewhere, move it to the parent proxies directory
         if old_proxy_path:
             try:
                 # Check for name collision
                 if proxy_path.exists():
-                    self._log(f"Error: Name collision detected. File already exists at: {proxy_path}")
+                    self._log(f"Error: Name collision detected. File already exists at: {proxy_path}", logging.ERROR)
                     file_details["result"] = "error"
                     file_details["error"] = f"Name collision detected at {proxy_path}"
-                    self.processed_files_details.append(file_details)
+                    self._record_details(file_details)
                     return
 
                 # Move the file
-                shutil.move(old_proxy_path, proxy_path)
+                self._fast_move(old_proxy_path, proxy_path)
+                self._invalidate_dir(old_proxy_path.parent, proxies_dir)
                 self._log(f"Moved existing proxy: {old_proxy_path} -> {proxy_path}")
                 self.stats['moved'] += 1
                 file_details["result"] = "moved"
                 file_details["moved_from"] = str(old_proxy_path)
-                self.processed_files_details.append(file_details)
+                self._record_details(file_details)
                 return
             except Exception as e:
-                self._log(f"Error moving proxy file: {str(e)}")
+                self._log(f"Error moving proxy file: {str(e)}", logging.ERROR)
                 file_details["result"] = "error"
                 file_details["error"] = f"Error moving proxy file: {str(e)}"
                 # Continue with transcoding if move fails
 
         # No valid proxies found, proceed with transcoding
         if file_details["result"] == "pending":  # Still need to transcode
-            self._log(f"No valid proxies found, proceeding with transcoding for: {video_path}")
+            self.log.info("No valid proxies found, proceeding with transcoding for: %s", video_path_s)
+
+            # Identical sources (e.g. renamed copies) share one proxy instead of being re-encoded
+            fingerprint_key = None
+            try:
+                fingerprint_key = f"{self._fingerprint(video_path).hex()}:{selected_codec}:{self.scale}"
+            except OSError as e:
+                self._log(f"Warning: Could not fingerprint {video_path}: {str(e)}", logging.WARNING)
+
+            if self._link_duplicate(video_path, proxy_path, fingerprint_key, file_details):
+                return
+
+            # One probe feeds both the audio and the source video decisions
+            try:
+                probe = self._probe_all(video_path_s, video_st)
+            except Exception as e:
+                self._log(f"Warning: Could not probe {video_path}: {str(e)}", logging.WARNING)
+                probe = {'video': {}, 'audio': {}, 'format': {}}
 
             # Get audio codec information for smart audio handling
-            audio_info = self._get_audio_codec_info(video_path)
+            audio_info = self._get_audio_codec_info(video_path, probe)
             should_copy_audio, audio_reason = self._should_copy_audio(audio_info)
             
-            self._log(f"Audio analysis: {audio_reason}")
+            self.log.info("Audio analysis: %s", audio_reason)
             file_details["audio_info"] = audio_info
             file_details["audio_decision"] = {
                 "should_copy": should_copy_audio,
@@ -906,7 +1597,7 @@ class ProxyGenerator:
             scaling = self._get_scaling_filter()
 
             # Check if source is 10-bit HEVC to apply special handling
-            source_info = self.codec_config._get_source_video_info(str(video_path))
+            source_info = self._get_source_video_info(video_path, probe)
             is_hevc_10bit = self.codec_config._is_hevc_10bit(source_info)
             
             # Get hardware acceleration and codec configuration
@@ -919,7 +1610,7 @@ class ProxyGenerator:
                 
                 # Override the output extension to .mp4 for H.264 encoding
                 output_extension = '.mp4'
-                proxy_name = f"{video_path.stem}_proxy{output_extension}"
+                proxy_name = f"{video_stem}_proxy{output_extension}"
                 proxy_path = proxies_dir / proxy_name
                 file_details["output_extension"] = output_extension
                 file_details["codec_decision"]["hevc_10bit_override"] = True
@@ -932,13 +1623,13 @@ class ProxyGenerator:
             video_filter, fallback_reason = self.codec_config.build_video_filter(
                 scaling, 
                 config.get('needs_format_conversion', False),
-                video_path=str(video_path),
-                target_codec=selected_codec
+                target_codec=selected_codec,
+                source_info=source_info
             )
             
             # Log CUDA optimizations or fallback reasons
             if fallback_reason:
-                self._log(f"⚠️  CUDA Fallback Applied: {fallback_reason}")
+                self._log(f"⚠️  CUDA Fallback Applied: {fallback_reason}", logging.WARNING)
                 self._log(f"   - Video filter: {video_filter}")
                 if is_hevc_10bit:
                     self._log(f"   - Using H.264 encoding and CPU scaling for 10-bit HEVC compatibility")
@@ -950,106 +1641,283 @@ class ProxyGenerator:
             elif config.get('needs_format_conversion', False):
                 self._log(f"Adding format=yuv420p filter for hardware acceleration")
             
+            # Decode on the GPU with an explicit NVDEC decoder where one matches the source
+            decoder_args = self.codec_config.get_hw_decoder_args(source_info, config['hw_accel_args'], video_path_s)
+            if decoder_args:
+                self._log(f"   - Hardware decoder: {decoder_args[1]}")
+
             file_details["codec_config"] = {
-                "hw_accel_args": config['hw_accel_args'],
+                "hw_accel_args": config['hw_accel_args'] + decoder_args,
                 "codec_args": config['codec_args'],
                 "video_filter": video_filter,
                 "needs_format_conversion": config.get('needs_format_conversion', False)
             }
 
-            # Build ffmpeg command
-            cmd = ['ffmpeg', '-hide_banner', '-y']
-            cmd.extend(config['hw_accel_args'])
-            cmd.extend(['-i', str(video_path)])
-            cmd.extend(['-vf', video_filter])
-            cmd.extend(config['codec_args'])
-            
             # Smart audio handling
             if should_copy_audio:
-                cmd.extend(['-c:a', 'copy'])
+                audio_args = AUDIO_COPY_ARGS
+            elif audio_info.get('has_audio', False):
+                audio_args = AUDIO_AAC_ARGS
             else:
-                if audio_info.get('has_audio', False):
-                    cmd.extend(['-c:a', 'aac', '-b:a', '128k'])
-                else:
-                    cmd.extend(['-an'])  # No audio
-            
-            cmd.append(str(proxy_path))
+                audio_args = AUDIO_NONE_ARGS
 
-            # Execute transcoding
-            start_time = time.time()
+            # Write to a temporary name and rename once ffmpeg succeeds, so an
+            # interrupted run never leaves a partial file at the proxy path
+            partial_path = proxy_path.with_name(f"{proxy_path.stem}.partial{proxy_path.suffix}")
+
+            # Build ffmpeg command in one pass from the per-file pieces and fixed argument tuples
+            cmd = [
+                *FFMPEG_PREFIX_ARGS,
+                *config['hw_accel_args'],
+                *decoder_args,
+                # Cap decoder and encoder threads so concurrent workers don't oversubscribe the CPU
+                *self._threads_args,
+                '-i', video_path_s,
+                '-vf', video_filter,
+                *config['codec_args'],
+                *self._threads_args,
+                *audio_args,
+                os.fspath(partial_path)
+            ]
+
+            if self.verbose:
+                self.log.debug("Running command: %s", shlex.join(cmd))
+            return {
+                "cmd": cmd,
+                "video_path": video_path,
+                "proxy_path": proxy_path,
+                "partial_path": partial_path,
+                "proxies_dir": proxies_dir,
+                "fingerprint_key": fingerprint_key,
+                "file_details": file_details
+            }
+
+        file_details["processing_end"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._record_details(file_details)
+
+    def _link_duplicate(self, video_path, proxy_path, fingerprint_key, file_details):
+        """Link the proxy of an identical, already transcoded source instead of encoding again
+
+        Returns:
+            bool: True if the file was handled by linking and its details were recorded
+        """
+        with self._cache_lock:
+            existing_proxy = self._fingerprints.get(fingerprint_key)
+        if not existing_proxy or not existing_proxy.exists():
+            return False
+        duplicate_path = proxy_path.with_suffix(existing_proxy.suffix)
+        if duplicate_path.exists():
+            return False
+        try:
+            self._link_or_copy(existing_proxy, duplicate_path)
+        except OSError as e:
+            self._log(f"Error linking existing proxy, transcoding instead: {str(e)}", logging.ERROR)
+            return False
+        try:
+            self._remember_proxy(duplicate_path, os.stat(duplicate_path))
+        except OSError:
+            pass
+        self._invalidate_dir(proxy_path.parent)
+        self._log(f"♻️  IDENTICAL SOURCE: {video_path.name} matches the source of {existing_proxy.name}")
+        self._log(f"   Linked existing proxy: {existing_proxy} -> {duplicate_path}")
+        self.stats['deduplicated'] += 1
+        file_details["result"] = "deduplicated"
+        file_details["duplicate_created"] = True
+        file_details["existing_proxy"] = str(existing_proxy)
+        file_details["processing_end"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._record_details(file_details)
+        return True
+
+    def _link_prepared_duplicate(self, job):
+        """Re-check a prepared job for an identical source that finished transcoding since it was prepared"""
+        return self._link_duplicate(job['video_path'], job['proxy_path'], job['fingerprint_key'], job['file_details'])
+
+    def _finish_transcode(self, job, returncode, stderr, duration):
+        """Publish a finished ffmpeg run's output and record its result"""
+        video_path = job['video_path']
+        proxy_path = job['proxy_path']
+        partial_path = job['partial_path']
+        file_details = job['file_details']
+
+        if returncode == 0:
+            os.replace(partial_path, proxy_path)
+            self._invalidate_dir(job['proxies_dir'])
             try:
-                self._log(f"Running command: {' '.join(cmd)}")
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-                duration = time.time() - start_time
-
-                # Log success
-                proxy_size = self._get_file_size(proxy_path)
-                human_duration = format_time_human(duration)
-
-                self._log(
-                    f"Transcoded: {video_path.name}\n"
-                    f"Time: {duration:.2f} seconds ({human_duration})\n"
-                    f"Original size: {file_details['size_mb']:.2f}MB\n"
-                    f"Proxy size: {proxy_size:.2f}MB\n"
-                    f"Command: {' '.join(cmd)}\n"
-                )
-                self.stats['transcoded'] += 1
+                self._remember_proxy(proxy_path, os.stat(proxy_path))
+            except OSError:
+                pass
 
-                file_details["result"] = "transcoded"
-                file_details["processing_time_seconds"] = duration
-                file_details["proxy_size_mb"] = proxy_size
-                file_details["compression_ratio"] = file_details['size_mb'] / proxy_size if proxy_size > 0 else "N/A"
+            # Log success
+            proxy_size = self._get_file_size(proxy_path)
+            human_duration = format_time_human(duration)
 
-            except subprocess.CalledProcessError as e:
-                self._log(f"Error transcoding {video_path.name}:\n{e.stderr}")
-                file_details["result"] = "error"
-                file_details["error"] = e.stderr
+            message = (
+                f"Transcoded: {video_path.name}\n"
+                f"Time: {duration:.2f} seconds ({human_duration})\n"
+                f"Original size: {file_details['size_mb']:.2f}MB\n"
+                f"Proxy size: {proxy_size:.2f}MB\n"
+            )
+            if self.verbose:
+                message += f"Command: {shlex.join(job['cmd'])}\n"
+            self._log(message)
+            self.stats['transcoded'] += 1
+
+            if job['fingerprint_key']:
+                with self._cache_lock:
+                    self._fingerprints[job['fingerprint_key']] = proxy_path
+
+            file_details["result"] = "transcoded"
+            file_details["processing_time_seconds"] = duration
+            file_details["proxy_size_mb"] = proxy_size
+            file_details["compression_ratio"] = file_details['size_mb'] / proxy_size if proxy_size > 0 else "N/A"
+        else:
+            self._log(f"Error transcoding {video_path.name}:\n{stderr}", logging.ERROR)
+            file_details["result"] = "error"
+            file_details["error"] = stderr
+            if partial_path.exists():
+                partial_path.unlink()
 
         file_details["processing_end"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.processed_files_details.append(file_details)
+        self._record_details(file_details)
+
+    def _setup_logging(self):
+        """Log to the console directly and to the log file through a queue listener thread
 
-    def _log(self, message):
+        Worker threads only enqueue records for the file; the console handler stays
+        synchronous so log lines keep their order relative to prompts and print() output.
+        """
+        logger = logging.getLogger(f"{__name__}.{id(self)}")
+        logger.setLevel(logging.DEBUG if self.verbose else logging.INFO)
+        logger.propagate = False
+        formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
+
+        # One append handle for the whole run, flushed in batches of LOG_BUFFER_RECORDS
+        self._log_file_handler = _BatchFileHandler(self.log_file, LOG_BUFFER_RECORDS,
+                                                   encoding='utf-8', delay=True)
+        self._log_file_handler.setFormatter(formatter)
+        self._log_listener = QueueListener(queue.SimpleQueue(), self._log_file_handler)
+        self._log_listener.start()
+        logger.addHandler(QueueHandler(self._log_listener.queue))
+        return logger
+
+    def _open_details_db(self):
+        """Create the per-run sqlite file that per-file records are written to"""
+        db = sqlite3.connect(self.details_db_file, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        # A run started within the same second reuses the file name; start it over
+        db.execute("DROP TABLE IF EXISTS files")
+        db.execute(
+            "CREATE TABLE files ("
+            "id INTEGER PRIMARY KEY, "
+            "filename TEXT NOT NULL, "
+            "result TEXT NOT NULL, "
+            "size_mb REAL, "
+            "processing_time_seconds REAL, "
+            "details TEXT NOT NULL)"
+        )
+        return db
+
+    def _record_details(self, file_details):
+        """Store a finished file's details; the full record is kept as JSON for the report"""
+        row = (
+            file_details['filename'],
+            file_details['result'],
+            file_details.get('size_mb'),
+            file_details.get('processing_time_seconds'),
+            json.dumps(file_details, default=str)
+        )
+        with self._details_lock:
+            self._details_db.execute(
+                "INSERT INTO files (filename, result, size_mb, processing_time_seconds, details) "
+                "VALUES (?, ?, ?, ?, ?)",
+                row
+            )
+            self._details_db.commit()
+
+    def _iter_details(self):
+        """Yield recorded file details in the order the files finished"""
+        with self._details_lock:
+            rows = self._details_db.execute("SELECT details FROM files ORDER BY id")
+        for (details,) in rows:
+            yield _json_loads(details)
+
+    def close(self):
+        """Flush queued log records to the log file, stop the listener thread and close the details file"""
+        db, self._details_db = self._details_db, None
+        if db is not None:
+            with self._details_lock:
+                db.close()
+        listener, self._log_listener = self._log_listener, None
+        if listener is not None:
+            listener.stop()
+            self._log_file_handler.close()  # Flushes the last partial batch
+
+    def _log(self, message, level=logging.INFO):
         """Write to log file and print to console"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
-        print(log_message, end='')
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_message)
+        self.log.log(level, message)
+
+    def _iter_videos(self, root):
+        """Yield source videos under root using os.scandir
+
+        DirEntry answers is_dir()/is_file() from the directory read itself, so the walk
+        costs one readdir per directory instead of a stat per entry. Entries are kept
+        for _source_stat.
+        """
+        stack = [os.fspath(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Skip Proxies directories
+                    if entry.name.lower() != "proxies":
+                        subdirs.append(entry.path)
+                    continue
+                # Skip files if extension not in video_extensions or if filename contains 'proxy';
+                # plain string slicing, a Path is only built for files that are kept
+                name = entry.name
+                dot = name.rfind('.')
+                if (dot > 0 and
+                        name[dot:].lower() in self.video_extensions and
+                        'proxy' not in name[:dot].lower() and
+                        entry.is_file()):
+                    video_path = Path(entry.path)
+                    self._source_entries[video_path] = entry
+                    yield video_path
+            # Reversed so subdirectories are walked in listing order
+            stack.extend(reversed(subdirs))
 
     def process_directory(self):
         """Process all video files in the directory"""
         if not self.source_path.is_dir():
-            self._log(f"Error: '{self.source_path}' is not a directory")
+            self._log(f"Error: '{self.source_path}' is not a directory", logging.ERROR)
             return
 
-        video_files = []
-        for root, _, files in os.walk(self.source_path):
-            # Skip Proxies directories
-            if Path(root).name.lower() == "proxies":
-                continue
-            for file in files:
-                file_path = Path(file)
-                # Skip files if extension not in video_extensions or if filename contains 'proxy'
-                if (file_path.suffix.lower() in self.video_extensions and
-                        'proxy' not in file_path.stem.lower()):
-                    video_files.append(Path(root) / file)
+        video_files = list(self._iter_videos(self.source_path))
 
         self.stats['total_files'] = len(video_files)
         self._log(f"Found {len(video_files)} video files")
 
         # Scan for conflicts before processing
-        conflicts = self._scan_for_conflicts(video_files)
+        conflicts, self._plans = self._scan_for_conflicts(video_files)
         
         # Resolve conflicts upfront
         self._resolve_conflicts_upfront(conflicts)
 
         if self.parallel:
-            # Use physical CPU cores count, max 8 concurrent processes
-            default_workers = min(os.cpu_count() // 2 or 1, 8)
-            max_workers = self.max_workers or default_workers
+            max_workers = self._get_worker_count()
             self._log(f"Running with {max_workers} concurrent processes")
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                list(executor.map(self._process_file, video_files))
+            asyncio.run(self._transcode_all_async(video_files, max_workers))
         else:
             for video_file in video_files:
                 self._process_file(video_file)
@@ -1059,21 +1927,21 @@ class ProxyGenerator:
     def process_single_file(self):
         """Process a single video file"""
         if not self.source_path.is_file():
-            self._log(f"Error: '{self.source_path}' is not a file")
+            self._log(f"Error: '{self.source_path}' is not a file", logging.ERROR)
             return
 
         if self.source_path.suffix.lower() not in self.video_extensions:
-            self._log(f"Error: '{self.source_path}' is not a supported video file")
+            self._log(f"Error: '{self.source_path}' is not a supported video file", logging.ERROR)
             return
 
         if 'proxy' in self.source_path.stem.lower():
-            self._log(f"Error: '{self.source_path}' appears to be a proxy file")
+            self._log(f"Error: '{self.source_path}' appears to be a proxy file", logging.ERROR)
             return
 
         self.stats['total_files'] = 1
         
         # Scan for conflicts before processing (even for single file)
-        conflicts = self._scan_for_conflicts([self.source_path])
+        conflicts, self._plans = self._scan_for_conflicts([self.source_path])
         
         # Resolve conflicts upfront
         self._resolve_conflicts_upfront(conflicts)
@@ -1082,29 +1950,42 @@ class ProxyGenerator:
         self._print_final_stats()
 
     def _shutdown_system(self):
-        """Initiate system shutdown with countdown"""
-        print("\nInitiating shutdown in 10 seconds...")
-        print("Press Ctrl+C to abort shutdown")
+        """Schedule a system shutdown in one minute and exit immediately.
 
+        The OS owns the countdown, so nothing in this process can hold up the shutdown.
+        """
+        if _SYSTEM == 'Windows':
+            cmd = ['shutdown', '/s', '/t', '60']
+            abort_cmd = 'shutdown /a'
+        elif _SYSTEM == 'Darwin':  # macOS
+            cmd = ['sudo', 'shutdown', '-h', '+1']
+            abort_cmd = 'sudo killall shutdown'
+        else:  # Linux
+            cmd = ['sudo', 'shutdown', '-h', '+1', 'proxy job done']
+            abort_cmd = 'sudo shutdown -c'
+
+        print("\nScheduling shutdown in 1 minute...")
         try:
-            for i in range(10, 0, -1):
-                sys.stdout.write(f"\rShutting down in {i} seconds...")
-                sys.stdout.flush()
-                time.sleep(1)
-
-            # Execute shutdown command based on OS
-            if platform.system() == 'Windows':
-                subprocess.run(['shutdown', '/s', '/t', '0'])
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['sudo', 'shutdown', '-h', 'now'])
-            else:  # Linux
-                subprocess.run(['sudo', 'shutdown', '-h', 'now'])
+            # Run in the foreground so sudo can still prompt; the OS schedules and returns
+            result = subprocess.run(cmd)
+        except OSError as e:
+            print(f"Could not schedule shutdown: {str(e)}")
+            return
 
-        except KeyboardInterrupt:
-            print("\nShutdown aborted!")
+        if result.returncode != 0:
+            print("Could not schedule shutdown")
+            return
+
+        print(f"Shutdown scheduled. Run '{abort_cmd}' to abort it")
+        self.close()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0)
 
     def _generate_detailed_report(self):
         """Generate a detailed report of all processed files and system information"""
+        now_str = time.strftime("%Y-%m-%d %H:%M:%S")
+
         # Generate descriptive filename
         total_time = time.time() - self.stats['start_time']
         cpu_name = self._get_filename_friendly_cpu()
@@ -1127,7 +2008,8 @@ class ProxyGenerator:
         descriptive_filename = "_".join(filename_parts) + ".txt"
         self.report_file = self.proxy_logs_dir / descriptive_filename
         
-        with open(self.report_file, 'w', encoding='utf-8') as f:
+        # Built in memory and written to disk in one go
+        with io.StringIO() as f:
             # System Information Section
             f.write("=" * 80 + "\n")
             f.write("SYSTEM INFORMATION\n")
@@ -1158,12 +2040,14 @@ class ProxyGenerator:
             
             if self.run_params['parallel']:
                 # Get actual workers used
-                actual_workers = self.max_workers or min(os.cpu_count() // 2 or 1, 8)
+                actual_workers = self._get_worker_count()
                 f.write(f"Max Workers Requested: {self.run_params['max_workers_requested'] or 'Auto'}\n")
+                f.write(f"Concurrency Profile: {self.run_params['concurrency_profile'] or 'Default'}\n")
                 f.write(f"Max Workers Actually Used: {actual_workers}\n")
                 f.write(f"Available CPU Cores: {os.cpu_count()}\n")
             else:
                 f.write("Max Workers: N/A (Single-threaded)\n")
+            f.write(f"FFmpeg Threads Per Invocation: {self.threads_per_job}\n")
                 
             f.write(f"Shutdown After Completion: {'Yes' if self.run_params['shutdown'] else 'No'}\n")
             
@@ -1181,6 +2065,8 @@ class ProxyGenerator:
             f.write(f"Proxies Moved: {self.stats['moved']}\n")
             if self.stats['sony_proxies_moved'] > 0:
                 f.write(f"Sony Camera Proxies Moved: {self.stats['sony_proxies_moved']}\n")
+            if self.stats['deduplicated'] > 0:
+                f.write(f"Identical Sources Linked: {self.stats['deduplicated']}\n")
             f.write("\n")
             
             # File Details Section
@@ -1188,62 +2074,73 @@ class ProxyGenerator:
             f.write("PER-FILE DETAILS\n")
             f.write("=" * 80 + "\n\n")
             
-            for idx, file_details in enumerate(self.processed_files_details, 1):
-                f.write(f"File {idx}: {file_details['filename']}\n")
-                f.write("-" * 80 + "\n")
-                f.write(f"Size: {file_details['size_mb']:.2f} MB\n")
-                f.write(f"Mobile Footage: {'Yes' if file_details.get('is_mobile_footage', False) else 'No'}\n")
-                f.write(f"Result: {file_details['result']}\n")
+            # Per-file sections are assembled in memory and written in one call
+            lines = []
+            add = lines.append
+            for idx, file_details in enumerate(self._iter_details(), 1):
+                get = file_details.get
+                result = file_details['result']
+                codec_decision = file_details['codec_decision']
+                audio_decision = get('audio_decision')
+                audio_info = get('audio_info', {})
+                codec_config = get('codec_config')
+
+                add(f"File {idx}: {file_details['filename']}\n")
+                add("-" * 80 + "\n")
+                add(f"Size: {file_details['size_mb']:.2f} MB\n")
+                add(f"Mobile Footage: {'Yes' if get('is_mobile_footage', False) else 'No'}\n")
+                add(f"Result: {result}\n")
                 
-                if file_details['result'] == 'skipped':
-                    f.write(f"Skip Reason: {file_details.get('skip_reason', 'Unknown')}\n")
+                if result == 'skipped':
+                    add(f"Skip Reason: {get('skip_reason', 'Unknown')}\n")
                 
-                if file_details['result'] == 'transcoded':
+                if result == 'transcoded':
                     processing_time = file_details['processing_time_seconds']
                     human_processing_time = format_time_human(processing_time)
-                    f.write(f"Processing Time: {processing_time:.2f} seconds ({human_processing_time})\n")
-                    f.write(f"Proxy Size: {file_details.get('proxy_size_mb', 'N/A'):.2f} MB\n")
-                    f.write(f"Compression Ratio: {file_details.get('compression_ratio', 'N/A'):.2f}x\n")
+                    add(f"Processing Time: {processing_time:.2f} seconds ({human_processing_time})\n")
+                    add(f"Proxy Size: {get('proxy_size_mb', 'N/A'):.2f} MB\n")
+                    add(f"Compression Ratio: {get('compression_ratio', 'N/A'):.2f}x\n")
                 
                 # Duplicate proxy information
-                if file_details.get('duplicate_created', False):
-                    f.write(f"Duplicate Proxy: Yes (existing proxy: {file_details.get('existing_proxy', 'Unknown')})\n")
+                if get('duplicate_created', False):
+                    add(f"Duplicate Proxy: Yes (existing proxy: {get('existing_proxy', 'Unknown')})\n")
                 
                 # Codec Decision Details
-                f.write("\nCodec Decision:\n")
-                f.write(f"  Requested Codec: {file_details['codec_decision'].get('requested_codec', 'Unknown')}\n")
-                f.write(f"  Actual Codec Used: {file_details['codec_decision'].get('actual_codec', 'Unknown')}\n")
-                f.write(f"  Reason: {file_details['codec_decision'].get('reason', 'Unknown')}\n")
-                f.write(f"  Output Extension: {file_details.get('output_extension', 'Unknown')}\n")
-                f.write(f"  Hardware Acceleration: {file_details.get('hw_acceleration', 'None')}\n")
+                add("\nCodec Decision:\n")
+                add(_CODEC_TMPL.format_map(_UnknownDefault(codec_decision)))
+                add(f"  Output Extension: {get('output_extension', 'Unknown')}\n")
+                add(f"  Hardware Acceleration: {get('hw_acceleration', 'None')}\n")
                 
                 # Audio Decision Details
-                if 'audio_decision' in file_details:
-                    f.write("\nAudio Processing:\n")
-                    audio_info = file_details.get('audio_info', {})
-                    f.write(f"  Has Audio: {'Yes' if audio_info.get('has_audio', False) else 'No'}\n")
-                    if audio_info.get('has_audio', False):
-                        f.write(f"  Source Codec: {audio_info.get('codec_name', 'Unknown')}\n")
-                        f.write(f"  Source Bitrate: {audio_info.get('bit_rate', 'Unknown')}\n")
-                        f.write(f"  Processing: {file_details['audio_decision'].get('reason', 'Unknown')}\n")
+                if audio_decision is not None:
+                    add("\nAudio Processing:\n")
+                    has_audio = audio_info.get('has_audio', False)
+                    add(f"  Has Audio: {'Yes' if has_audio else 'No'}\n")
+                    if has_audio:
+                        add(f"  Source Codec: {audio_info.get('codec_name', 'Unknown')}\n")
+                        add(f"  Source Bitrate: {audio_info.get('bit_rate', 'Unknown')}\n")
+                        add(f"  Processing: {audio_decision.get('reason', 'Unknown')}\n")
                 
-                if 'codec_config' in file_details:
-                    f.write("\nCodec Configuration:\n")
-                    f.write(f"  Hardware Acceleration Args: {' '.join(file_details['codec_config'].get('hw_accel_args', []))}\n")
-                    f.write(f"  Codec Args: {' '.join(file_details['codec_config'].get('codec_args', []))}\n")
-                    f.write(f"  Video Filter: {file_details['codec_config'].get('video_filter', 'Unknown')}\n")
-                    f.write(f"  Format Conversion (10->8 bit): {'Yes' if file_details['codec_config'].get('needs_format_conversion', False) else 'No'}\n")
+                if codec_config is not None:
+                    add("\nCodec Configuration:\n")
+                    add(f"  Hardware Acceleration Args: {' '.join(codec_config.get('hw_accel_args', []))}\n")
+                    add(f"  Codec Args: {' '.join(codec_config.get('codec_args', []))}\n")
+                    add(f"  Video Filter: {codec_config.get('video_filter', 'Unknown')}\n")
+                    add(f"  Format Conversion (10->8 bit): {'Yes' if codec_config.get('needs_format_conversion', False) else 'No'}\n")
                 
-                if file_details['result'] == 'error':
-                    f.write("\nError Information:\n")
-                    f.write(f"{file_details.get('error', 'Unknown error')}\n")
-                
-                f.write("\n")  # Extra space between files
+                if result == 'error':
+                    add("\nError Information:\n")
+                    add(f"{get('error', 'Unknown error')}\n")
                 
+                add("\n")  # Extra space between files
+            f.writelines(lines)
+
             f.write("\n" + "=" * 80 + "\n")
-            f.write("REPORT GENERATED: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "\n")
+            f.write("REPORT GENERATED: " + now_str + "\n")
             f.write("=" * 80 + "\n")
-            
+
+            self.report_file.write_text(f.getvalue(), encoding='utf-8')
+
         return self.report_file
 
     def _generate_benchmark_json(self):
@@ -1252,10 +2149,7 @@ class ProxyGenerator:
         human_time = format_time_human(total_time)
         
         # Determine actual workers used
-        if self.parallel:
-            actual_workers = self.max_workers or min(os.cpu_count() // 2 or 1, 8)
-        else:
-            actual_workers = 1
+        actual_workers = self._get_worker_count()
         
         benchmark_data = {
             "completion_time_seconds": round(total_time, 2),
@@ -1264,6 +2158,7 @@ class ProxyGenerator:
                 "codec": self.codec_config.selected_codec,
                 "parallel": self.parallel,
                 "max_workers": actual_workers,
+                "ffmpeg_threads": self.threads_per_job,
                 "scale": self.scale,
                 "input_path": str(self.source_path),
                 "hardware_acceleration": self.codec_config.hw_acceleration or "none"
@@ -1278,34 +2173,46 @@ class ProxyGenerator:
                 "transcoded": self.stats['transcoded'],
                 "skipped": self.stats['skipped'],
                 "moved": self.stats['moved'],
-                "sony_proxies_moved": self.stats['sony_proxies_moved']
+                "sony_proxies_moved": self.stats['sony_proxies_moved'],
+                "deduplicated": self.stats['deduplicated']
             },
             "timestamp": self.timestamp
         }
         
         # Generate JSON filename
-        json_filename = f"benchmark-{self.codec_config.selected_codec}-{actual_workers}workers-{self.timestamp}.json"
+        json_filename = self._benchmark_json_name_tmpl.format(workers=actual_workers)
         json_path = self.proxy_logs_dir / json_filename
         
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(benchmark_data, f, indent=2)
+        with open(json_path, 'wb') as f:
+            f.write(_json_dumps(benchmark_data, indent=True))
         
         return json_path, benchmark_data
 
     def _print_final_stats(self):
         """Print final statistics and generate detailed report"""
-        total_time = time.time() - self.stats['start_time']
+        stats = self.stats
+        total_time = time.time() - stats['start_time']
         human_time = format_time_human(total_time)
-        sony_summary = f"\nSony proxies moved: {self.stats['sony_proxies_moved']}\n" if self.stats['sony_proxies_moved'] > 0 else ""
-        
-        self._log(
-            f"\nFinal Report:\n"
-            f"Total time: {total_time:.2f} seconds ({human_time})\n"
-            f"Total files found: {self.stats['total_files']}\n"
-            f"Files transcoded: {self.stats['transcoded']}\n"
-            f"Files skipped: {self.stats['skipped']}\n"
-            f"Proxies moved: {self.stats['moved']}{sony_summary}"
-        )
+
+        # One log record for the whole summary
+        parts = [
+            "\nFinal Report:\n",
+            f"Total time: {total_time:.2f} seconds ({human_time})\n",
+            f"Total files found: {stats['total_files']}\n",
+            f"Files transcoded: {stats['transcoded']}\n",
+            f"Files skipped: {stats['skipped']}\n",
+            f"Proxies moved: {stats['moved']}",
+        ]
+        if stats['sony_proxies_moved'] > 0:
+            parts.append(f"\nSony proxies moved: {stats['sony_proxies_moved']}")
+        if stats['deduplicated'] > 0:
+            parts.append(f"\nIdentical sources linked: {stats['deduplicated']}")
+        self._log(''.join(parts))
+
+        # The cache sidecar is the largest write; it runs on its own thread while the
+        # report and benchmark JSON are built and written
+        self._cache_writer = threading.Thread(target=self._save_cache)
+        self._cache_writer.start()
         
         # Generate detailed report
         report_path = self._generate_detailed_report()
@@ -1316,78 +2223,185 @@ class ProxyGenerator:
             json_path, json_data = self._generate_benchmark_json()
             self._log(f"Benchmark JSON generated at: {json_path}\n")
 
+        self._cache_writer.join()
+
         if self.shutdown:
             self._shutdown_system()
 
     def process(self):
         """Process either a single file or directory based on input"""
-        if self.source_path.is_dir():
-            self.process_directory()
-        else:
-            self.process_single_file()
+        try:
+            if self.source_path.is_dir():
+                self.process_directory()
+            else:
+                self.process_single_file()
+        except KeyboardInterrupt:
+            # Keep the probes and fingerprints gathered so far for the next run, after
+            # any save already running from _print_final_stats has finished
+            if self._cache_writer is not None:
+                self._cache_writer.join()
+            self._save_cache()
+            raise
+        finally:
+            self.close()
+
+    def _get_cached_probe(self, video_path, st):
+        """Return the cached probe for a file if it is unchanged since it was probed"""
+        with self._cache_lock:
+            entry = self._probe_cache.get(str(video_path))
+        if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+            return entry['probe']
+        return None
+
+    def _store_probe(self, video_path, st, probe):
+        """Cache a probe result against the file's mtime and size"""
+        with self._cache_lock:
+            self._probe_cache[str(video_path)] = {
+                'mtime_ns': st.st_mtime_ns,
+                'size': st.st_size,
+                'probe': probe
+            }
+
+    def _parse_probe(self, data):
+        """Reduce ffprobe output to the first video stream, first audio stream and format"""
+        streams = data.get('streams', [])
+        return {
+            'video': next((stream for stream in streams if stream.get('codec_type') == 'video'), {}),
+            'audio': next((stream for stream in streams if stream.get('codec_type') == 'audio'), {}),
+            'format': data.get('format', {})
+        }
+
+    def _probe_all(self, video_path, st=None):
+        """Probe all streams of a file with a single ffprobe call, memoized on mtime and size
+
+        Returns:
+            dict: {'video': {...}, 'audio': {...}, 'format': {...}}
+        """
+        if st is None:
+            st = os.stat(video_path)
+        probe = self._get_cached_probe(video_path, st)
+        if probe is None:
+            probe = self._probe_with_av(video_path) if av is not None else None
+            if probe is None:
+                # -v quiet leaves nothing on stderr worth reading
+                result = subprocess.run(PROBE_ARGS + (os.fspath(video_path),), stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL, check=True, **SUBPROC_KW)
+                probe = self._parse_probe(_json_loads(result.stdout))
+            self._store_probe(video_path, st, probe)
+        return probe
+
+    def _probe_with_av(self, video_path):
+        """Read the first video and audio stream with PyAV, in the same shape as _parse_probe
+
+        Returns None if PyAV can't open the file, so the caller falls back to ffprobe.
+        """
+        try:
+            with av.open(os.fspath(video_path)) as container:
+                video = next(iter(container.streams.video), None)
+                audio = next(iter(container.streams.audio), None)
+                probe = {'video': {}, 'audio': {}, 'format': {'format_name': container.format.name}}
+                if video is not None:
+                    ctx = video.codec_context
+                    probe['video'] = {
+                        'codec_type': 'video',
+                        'codec_name': ctx.name,
+                        'profile': ctx.profile or 'unknown',
+                        'pix_fmt': ctx.pix_fmt or 'unknown'
+                    }
+                if audio is not None:
+                    ctx = audio.codec_context
+                    probe['audio'] = {
+                        'codec_type': 'audio',
+                        'codec_name': ctx.name,
+                        'codec_long_name': ctx.codec.long_name,
+                        'bit_rate': str(ctx.bit_rate) if ctx.bit_rate else 'unknown',
+                        'sample_rate': str(ctx.sample_rate) if ctx.sample_rate else 'unknown'
+                    }
+                return probe
+        except Exception:
+            return None
 
-    def _get_audio_codec_info(self, video_path):
+    def _get_source_video_info(self, video_path, probe=None):
+        """Get source video format information from the consolidated probe"""
+        try:
+            if probe is None:
+                probe = self._probe_all(video_path)
+            return self.codec_config._video_info_from_stream(probe['video'])
+        except Exception:
+            # If detection fails, fall back to the codec configuration's safe defaults
+            return self.codec_config._video_info_from_stream({})
+
+    def _get_audio_codec_info(self, video_path, probe=None):
         """Get audio codec information from video file"""
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-select_streams', 'a:0',
-                '-show_entries', 'stream=codec_name,codec_long_name,bit_rate,sample_rate',
-                '-of', 'json',
-                str(video_path)
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
-            
-            if 'streams' in data and len(data['streams']) > 0:
-                stream = data['streams'][0]
-                return {
-                    'codec_name': stream.get('codec_name', 'unknown'),
-                    'codec_long_name': stream.get('codec_long_name', 'unknown'),
-                    'bit_rate': stream.get('bit_rate', 'unknown'),
-                    'sample_rate': stream.get('sample_rate', 'unknown'),
-                    'has_audio': True
-                }
-            else:
-                return {'has_audio': False}
-                
+            if probe is None:
+                probe = self._probe_all(video_path)
+            stream = probe['audio']
         except Exception as e:
-            self._log(f"Warning: Could not detect audio codec for {video_path}: {str(e)}")
+            self._log(f"Warning: Could not detect audio codec for {video_path}: {str(e)}", logging.WARNING)
             return {'has_audio': False}
 
+        if not stream:
+            return {'has_audio': False}
+        return {
+            'codec_name': stream.get('codec_name', 'unknown'),
+            'codec_long_name': stream.get('codec_long_name', 'unknown'),
+            'bit_rate': stream.get('bit_rate', 'unknown'),
+            'sample_rate': stream.get('sample_rate', 'unknown'),
+            'has_audio': True
+        }
+
+    async def _probe_all_async(self, video_path, st, semaphore):
+        """Probe a file without blocking the event loop, caching the result against st"""
+        async with semaphore:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *PROBE_ARGS, os.fspath(video_path),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                stdout, _ = await proc.communicate()
+                if proc.returncode == 0:
+                    self._store_probe(video_path, st, self._parse_probe(_json_loads(stdout)))
+            except Exception:
+                # Leave it uncached; the synchronous probe will retry and log the failure
+                pass
+
+    async def _prefetch_probes_async(self, stat_pairs):
+        """Run probes for (path, stat) pairs concurrently, bounded by PROBE_CONCURRENCY"""
+        semaphore = asyncio.Semaphore(PROBE_CONCURRENCY)
+        await asyncio.gather(*[self._probe_all_async(path, st, semaphore) for path, st in stat_pairs])
+
+    def _prefetch_probes(self, video_files):
+        """Populate the probe cache for files that are not already cached
+
+        The cache checks run on a thread pool too: on network volumes each stat is a round trip.
+        """
+        with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS) as executor:
+            if av is not None:
+                # In-process probes check the cache themselves; threads overlap the file reads
+                list(executor.map(self._prefetch_probe, video_files))
+                return
+            stats = list(executor.map(self._source_stat, video_files))
+        missing = [(path, st) for path, st in zip(video_files, stats)
+                   if st is not None and self._get_cached_probe(path, st) is None]
+        if missing:
+            asyncio.run(self._prefetch_probes_async(missing))
+
+    def _prefetch_probe(self, video_path):
+        """Probe one file into the cache, leaving failures to the synchronous probe"""
+        try:
+            self._probe_all(video_path)
+        except Exception:
+            pass
+
     def _should_copy_audio(self, audio_info):
         """Determine if audio should be copied or re-encoded based on codec"""
         if not audio_info.get('has_audio', False):
             return False, "No audio stream"
             
-        codec_name = audio_info.get('codec_name', '').lower()
-        
-        # List of compressed audio codecs that should be copied
-        compressed_codecs = {
-            'aac', 'mp3', 'ac3', 'eac3', 'dts', 'truehd', 'flac', 'vorbis', 'opus'
-        }
-        
-        # List of uncompressed/large audio codecs that should be re-encoded
-        uncompressed_codecs = {
-            'pcm_s16be', 'pcm_s16le', 'pcm_s24be', 'pcm_s24le', 'pcm_s32be', 'pcm_s32le',
-            'pcm_f32be', 'pcm_f32le', 'pcm_f64be', 'pcm_f64le'
-        }
-        
-        if codec_name in compressed_codecs:
-            return True, f"Compressed codec ({codec_name}) - copying"
-        elif codec_name in uncompressed_codecs:
-            return False, f"Uncompressed codec ({codec_name}) - re-encoding to AAC"
-        else:
-            # For unknown codecs, check bit rate if available
-            try:
-                bit_rate = int(audio_info.get('bit_rate', 0))
-                if bit_rate > 1000000:  # > 1 Mbps, likely uncompressed
-                    return False, f"High bitrate ({bit_rate} bps) - re-encoding to AAC"
-                else:
-                    return True, f"Unknown codec ({codec_name}) with reasonable bitrate - copying"
-            except (ValueError, TypeError):
-                return True, f"Unknown codec ({codec_name}) - copying (default)"
+        # Few distinct codec/bitrate pairs occur in a shoot, so decisions are memoized
+        return _classify_audio(audio_info.get('codec_name', '').lower(), audio_info.get('bit_rate', 0))
 
 def _clean_path_input(path_input):
     """Clean path input to handle copy-paste scenarios with quotes and escaping"""
@@ -1398,7 +2412,10 @@ def _clean_path_input(path_input):
     cleaned = path_input.strip()
     
     # If the input is already quoted, use shlex to handle it properly
-    if (cleaned.startswith('"') and cleaned.endswith('"')) or (cleaned.startswith("'") and cleaned.endswith("'")):
+    if len(cleaned) >= 2 and cleaned[0] == cleaned[-1] and cleaned[0] in ('"', "'"):
+        # Plain quoted path: peeling the quotes gives what shlex would
+        if not _QUOTE_OR_ESC_RE.search(cleaned, 1, len(cleaned) - 1):
+            return cleaned[1:-1]
         try:
             parsed = shlex.split(cleaned)
             return parsed[0] if len(parsed) == 1 else ' '.join(parsed)
@@ -1406,17 +2423,15 @@ def _clean_path_input(path_input):
             # If shlex fails, manually strip quotes
             return cleaned[1:-1] if len(cleaned) >= 2 else cleaned
     
-    # For Windows, check if this looks like a drive path (e.g., C:\, D:\, F:\)
-    # If so, treat the entire input as a single path regardless of spaces
-    if platform.system() == "Windows":
-        # Check for Windows drive letter pattern (e.g., C:, D:, F:)
-        if len(cleaned) >= 2 and cleaned[1] == ':' and cleaned[0].isalpha():
-            # This looks like a Windows path, return as-is
-            return cleaned
-        # Also check for UNC paths (\\server\share)
-        elif cleaned.startswith('\\\\'):
-            return cleaned
+    # For Windows, check if this looks like a drive path (e.g., C:\, D:\, F:\) or a UNC
+    # path (\\server\share). If so, treat the entire input as a single path regardless of spaces
+    if _SYSTEM == "Windows" and _WIN_DRIVE_OR_UNC_RE.match(cleaned):
+        return cleaned
     
+    # Without quotes or escapes shlex only splits on its own whitespace set
+    if not _QUOTE_OR_ESC_RE.search(cleaned):
+        return _SHLEX_WHITESPACE_RE.sub(' ', cleaned)
+
     # For non-Windows or paths that don't look like drive paths, try shlex
     try:
         parsed = shlex.split(cleaned)
@@ -1432,36 +2447,6 @@ def main():
     print("🎬 VIDEO PROXY GENERATOR")
     print("=" * 80)
     
-    if len(sys.argv) > 1:
-        # Process quoted paths while preserving other arguments
-        args = sys.argv[1:]
-        new_args = []
-        in_quotes = False
-        path_parts = []
-
-        for arg in args:
-            if (arg.startswith('"') or arg.startswith("'")) and not in_quotes:
-                in_quotes = True
-                path_parts.append(arg)
-            elif (arg.endswith('"') or arg.endswith("'")) and in_quotes:
-                in_quotes = False
-                path_parts.append(arg)
-                full_path = ' '.join(path_parts)
-                full_path = full_path.strip('"').strip("'")
-                new_args.append(full_path)
-                path_parts = []
-            elif in_quotes:
-                path_parts.append(arg)
-            else:
-                new_args.append(arg)
-
-        if path_parts:
-            full_path = ' '.join(path_parts)
-            full_path = full_path.strip('"').strip("'")
-            new_args.append(full_path)
-
-        sys.argv[1:] = new_args
-
     parser = argparse.ArgumentParser(description='Generate video proxies')
     parser.add_argument('path', nargs='?',
                         help='Source path (directory or video file)')
@@ -1473,14 +2458,30 @@ def main():
                         help='Disable parallel processing (parallel is enabled by default)')
     parser.add_argument('--max-workers', type=int,
                         help='Maximum number of concurrent processes for parallel processing')
+    parser.add_argument('--concurrency-profile', choices=['cpu', 'nvenc'],
+                        help='Worker defaults for the encoder: cpu (libx264/libx265, few processes using all cores) '
+                             'or nvenc (2 concurrent GPU sessions)')
+    parser.add_argument('--ffmpeg-threads-per-invocation', '--ffmpeg-threads', type=int, dest='ffmpeg_threads',
+                        help=f'Threads per ffmpeg process, 1-{MAX_FFMPEG_THREADS} '
+                             f'(default: CPU cores / workers, or ${FFMPEG_THREADS_ENV})')
     parser.add_argument('--shutdown', action='store_true',
                         help='Shutdown the computer when processing is complete')
     parser.add_argument('--json-output', action='store_true',
                         help='Generate JSON output for benchmarking')
     parser.add_argument('--prompt-existing', action='store_true',
                         help='Prompt for each video that already has a proxy with different extension (default: auto-skip)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Log the full ffmpeg command for every file')
 
-    args = parser.parse_args()
+    args, extra = parser.parse_known_args()
+
+    # A path with spaces that reached us as several arguments (unquoted, or quoted in a
+    # way the shell didn't honour) is put back together here; _clean_path_input strips quotes
+    stray = [arg for arg in extra if not arg.startswith('-')]
+    if len(stray) != len(extra):
+        parser.error(f"unrecognized arguments: {' '.join(arg for arg in extra if arg.startswith('-'))}")
+    if stray:
+        args.path = ' '.join([args.path, *stray])
 
     # Display current settings
     _display_current_settings(args)
@@ -1493,9 +2494,12 @@ def main():
     args.path = _clean_path_input(args.path)
 
     # Ensure the path exists and is accessible
-    source_path = Path(args.path).expanduser().resolve()
-    if not source_path.exists():
-        print(f"❌ Error: Path '{source_path}' does not exist")
+    # realpath(strict=True) resolves the path and checks that it exists in one pass
+    expanded_path = os.path.expanduser(args.path)
+    try:
+        source_path = Path(os.path.realpath(expanded_path, strict=True))
+    except OSError:
+        print(f"❌ Error: Path '{os.path.abspath(expanded_path)}' does not exist")
         print("Please check the path and try again.")
         sys.exit(1)
 
@@ -1511,7 +2515,10 @@ def main():
         max_workers=args.max_workers,
         shutdown=args.shutdown,
         json_output=args.json_output,
-        skip_existing=not args.prompt_existing
+        skip_existing=not args.prompt_existing,
+        concurrency_profile=args.concurrency_profile,
+        ffmpeg_threads=args.ffmpeg_threads,
+        verbose=args.verbose
     )
     generator.process()
 
@@ -1525,11 +2532,17 @@ def _display_current_settings(args):
     if not args.no_parallel and args.max_workers:
         print(f"Max Workers: {args.max_workers}")
     elif not args.no_parallel:
-        default_workers = min(os.cpu_count() // 2 or 1, 8)
+        default_workers = default_worker_count(args.concurrency_profile)
         print(f"Max Workers: {default_workers} (auto-detected)")
+    if args.concurrency_profile:
+        print(f"Concurrency Profile: {args.concurrency_profile}")
+    if args.ffmpeg_threads:
+        print(f"FFmpeg Threads Per Invocation: {args.ffmpeg_threads}")
     print(f"Prompt for Existing: {'Yes' if args.prompt_existing else 'No (auto-skip)'}")
     print(f"Auto-shutdown: {'Yes' if args.shutdown else 'No'}")
     print(f"JSON Output: {'Yes' if args.json_output else 'No'}")
+    if args.verbose:
+        print("Verbose: Yes")
     print()
 
 def _prompt_for_path():